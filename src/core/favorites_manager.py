@@ -15,6 +15,15 @@ logger = logging.getLogger(__name__)
 class FavoritesManager:
     """Gestor de items favoritos"""
 
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "FavoritesManager":
+        """Retorna la instancia compartida (base de datos por defecto)"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def __init__(self, db_path: str = "widget_sidebar.db"):
         """Inicializar manager"""
         self.db_path = Path(db_path)
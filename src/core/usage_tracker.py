@@ -17,6 +17,15 @@ logger = logging.getLogger(__name__)
 class UsageTracker:
     """Gestor de tracking de uso de items"""
 
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "UsageTracker":
+        """Retorna la instancia compartida (base de datos por defecto)"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def __init__(self, db_path: str = "widget_sidebar.db"):
         """Inicializar tracker"""
         self.db_path = Path(db_path)
@@ -3744,32 +3744,44 @@ class DBManager:
             logger.error(f"Error al agregar marcador: {e}")
             return None
 
-    def get_bookmarks(self, folder: str = None) -> List[Dict]:
+    def get_bookmarks(self, folder: str = None, limit: int = None,
+                      offset: int = 0) -> List[Dict]:
         """
-        Obtiene todos los marcadores, opcionalmente filtrados por carpeta.
+        Obtiene los marcadores, opcionalmente filtrados por carpeta y paginados.
+
+        Cada marcador incluye 'display_url': la URL truncada a 60 caracteres
+        para mostrar en listas.
 
         Args:
             folder: Carpeta para filtrar (None = todos)
+            limit: Número máximo de marcadores a devolver (None = sin límite)
+            offset: Número de marcadores a saltar (solo con limit)
 
         Returns:
             List[Dict]: Lista de marcadores
         """
         try:
+            query = """
+                SELECT id, title, url, folder, icon, created_at, order_index,
+                       CASE WHEN length(url) > 60
+                            THEN substr(url, 1, 60) || '...'
+                            ELSE url
+                       END AS display_url
+                FROM bookmarks
+            """
+            params = []
+
             if folder is not None:
-                query = """
-                    SELECT id, title, url, folder, icon, created_at, order_index
-                    FROM bookmarks
-                    WHERE folder = ?
-                    ORDER BY order_index ASC, created_at DESC
-                """
-                result = self.execute_query(query, (folder,))
-            else:
-                query = """
-                    SELECT id, title, url, folder, icon, created_at, order_index
-                    FROM bookmarks
-                    ORDER BY order_index ASC, created_at DESC
-                """
-                result = self.execute_query(query)
+                query += " WHERE folder = ?"
+                params.append(folder)
+
+            query += " ORDER BY order_index ASC, created_at DESC, id DESC"
+
+            if limit is not None:
+                query += " LIMIT ? OFFSET ?"
+                params.extend([limit, offset])
+
+            result = self.execute_query(query, tuple(params))
 
             return result if result else []
 
@@ -3777,6 +3789,30 @@ class DBManager:
             logger.error(f"Error al obtener marcadores: {e}")
             return []
 
+    def count_bookmarks(self, folder: str = None) -> int:
+        """
+        Cuenta los marcadores, opcionalmente filtrados por carpeta.
+
+        Args:
+            folder: Carpeta para filtrar (None = todos)
+
+        Returns:
+            int: Número de marcadores
+        """
+        try:
+            if folder is not None:
+                query = "SELECT COUNT(*) as count FROM bookmarks WHERE folder = ?"
+                result = self.execute_query(query, (folder,))
+            else:
+                query = "SELECT COUNT(*) as count FROM bookmarks"
+                result = self.execute_query(query)
+
+            return result[0]['count'] if result else 0
+
+        except Exception as e:
+            logger.error(f"Error al contar marcadores: {e}")
+            return 0
+
     def delete_bookmark(self, bookmark_id: int) -> bool:
         """
         Elimina un marcador por su ID.
@@ -3,7 +3,7 @@ Effects - Sistema de efectos visuales especiales futuristas
 """
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import QTimer, QPointF, QRectF, Qt, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor, QPen, QLinearGradient, QRadialGradient, QPainterPath
+from PyQt6.QtGui import QPainter, QColor, QPen, QLinearGradient, QRadialGradient, QPainterPath, QPixmap
 import random
 import math
 from typing import List, Tuple
@@ -384,6 +384,49 @@ class NeonGlow:
         widget.setGraphicsEffect(shadow)
 
 
+class PanelChrome:
+    """Fondo redondeado con borde de un panel, rasterizado una vez y reutilizado"""
+
+    def __init__(self, background: str, border: str, border_width: int, radius: int):
+        self.background = QColor(background)
+        self.border = QColor(border)
+        self.border_width = border_width
+        self.radius = radius
+        self._pixmap = None
+        self._pixmap_key = None
+
+    def _render(self, width: int, height: int, device_pixel_ratio: float) -> QPixmap:
+        """Rasterizar el fondo para un tamaño dado"""
+        pixmap = QPixmap(round(width * device_pixel_ratio), round(height * device_pixel_ratio))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        inset = self.border_width / 2
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(self.border, self.border_width))
+        painter.setBrush(self.background)
+        painter.drawRoundedRect(
+            QRectF(inset, inset, width - self.border_width, height - self.border_width),
+            self.radius, self.radius
+        )
+        painter.end()
+
+        return pixmap
+
+    def paint(self, widget: QWidget):
+        """Dibujar el fondo cacheado sobre el widget (llamar desde paintEvent)"""
+        device_pixel_ratio = widget.devicePixelRatioF()
+        key = (widget.width(), widget.height(), device_pixel_ratio)
+        if key != self._pixmap_key:
+            self._pixmap = self._render(widget.width(), widget.height(), device_pixel_ratio)
+            self._pixmap_key = key
+
+        painter = QPainter(widget)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+
+
 # Función helper para aplicar múltiples efectos a un widget
 def apply_effects(widget: QWidget, effects: List[str] = None):
     """
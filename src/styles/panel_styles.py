@@ -5,6 +5,8 @@ para los paneles de Categoría, Búsqueda Global y Proceso
 """
 from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, QRect
 from PyQt6.QtWidgets import QWidget
+import functools
+import html
 
 
 class PanelStyles:
@@ -300,52 +302,20 @@ class PanelStyles:
         """
 
     @staticmethod
-    def get_item_style() -> str:
-        """
-        Retorna el estilo CSS base para items individuales
-
-        Incluye:
-        - Altura fija: 32px
-        - Padding optimizado: 6px vertical, 10px horizontal
-        - Border-radius: 4px
-        - Estados: normal, hover, activo
-        - Transiciones suaves: 150ms
-
-        Ejemplo:
-            item = QWidget()
-            item.setStyleSheet(PanelStyles.get_item_style())
-        """
-        return f"""
-            QWidget {{
-                background-color: transparent;
-                border: none;
-                border-left: 3px solid transparent;
-                border-radius: {PanelStyles.ITEM_BORDER_RADIUS}px;
-                padding: {PanelStyles.ITEM_PADDING_V}px {PanelStyles.ITEM_PADDING_H}px;
-                min-height: {PanelStyles.ITEM_HEIGHT}px;
-                max-height: {PanelStyles.ITEM_HEIGHT}px;
-                transition: background-color 150ms ease, border-left 150ms ease;
-            }}
-            QWidget:hover {{
-                background-color: {PanelStyles.BACKGROUND_HOVER};
-            }}
-            QWidget[active="true"] {{
-                background-color: {PanelStyles.BACKGROUND_ACTIVE};
-                border-left: 3px solid {PanelStyles.ACCENT_PRIMARY};
-            }}
-        """
-
-    @staticmethod
-    def get_item_label_style() -> str:
+    @functools.lru_cache(maxsize=None)
+    def get_item_label_style(selector: str = "QLabel") -> str:
         """
         Retorna el estilo CSS para labels de items
 
+        Args:
+            selector: Selector QSS al que se aplica (ej: "QLabel#itemLabel")
+
         Ejemplo:
             label = QLabel("Item label")
             label.setStyleSheet(PanelStyles.get_item_label_style())
         """
         return f"""
-            QLabel {{
+            {selector} {{
                 color: {PanelStyles.TEXT_PRIMARY};
                 font-size: {PanelStyles.ITEM_FONT_SIZE}pt;
                 font-weight: {PanelStyles.FONT_WEIGHT_NORMAL};
@@ -357,16 +327,12 @@ class PanelStyles:
         """
 
     @staticmethod
-    def get_badge_style(badge_type: str = 'default') -> str:
+    def get_badge_colors(badge_type: str = 'default') -> tuple:
         """
-        Retorna el estilo CSS para badges (favorito, popular, nuevo)
+        Retorna (color de fondo, color de texto) para un tipo de badge
 
         Args:
             badge_type: Tipo de badge ('favorite', 'popular', 'new', 'default')
-
-        Ejemplo:
-            badge = QLabel("⭐")
-            badge.setStyleSheet(PanelStyles.get_badge_style('favorite'))
         """
         # Colores según tipo
         colors = {
@@ -375,8 +341,22 @@ class PanelStyles:
             'new': (PanelStyles.ACCENT_PRIMARY, '#ffffff'),       # Azul, texto blanco
             'default': (PanelStyles.ACCENT_SUBTLE, PanelStyles.TEXT_SECONDARY),
         }
+        return colors.get(badge_type, colors['default'])
 
-        bg_color, text_color = colors.get(badge_type, colors['default'])
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_badge_style(badge_type: str = 'default') -> str:
+        """
+        Retorna el estilo CSS para badges (favorito, popular, nuevo)
+
+        Args:
+            badge_type: Tipo de badge ('favorite', 'popular', 'new', 'default')
+
+        Ejemplo:
+            badge = QLabel("⭐")
+            badge.setStyleSheet(PanelStyles.get_badge_style('favorite'))
+        """
+        bg_color, text_color = PanelStyles.get_badge_colors(badge_type)
 
         return f"""
             QLabel {{
@@ -392,6 +372,30 @@ class PanelStyles:
         """
 
     @staticmethod
+    def get_badge_html(text: str, badge_type: str = 'default') -> str:
+        """
+        Retorna un badge como fragmento HTML para labels con texto enriquecido
+
+        Permite mostrar varios badges en un único QLabel (Qt.TextFormat.RichText)
+
+        Args:
+            text: Texto del badge (se escapa como HTML)
+            badge_type: Tipo de badge ('favorite', 'popular', 'new', 'default')
+
+        Ejemplo:
+            badges = QLabel(PanelStyles.get_badge_html("⭐", 'favorite'))
+            badges.setTextFormat(Qt.TextFormat.RichText)
+        """
+        bg_color, text_color = PanelStyles.get_badge_colors(badge_type)
+        return (
+            f"<span style=\"background-color: {bg_color}; color: {text_color}; "
+            f"font-size: {PanelStyles.BADGE_FONT_SIZE}pt; "
+            f"font-weight: {PanelStyles.FONT_WEIGHT_SEMIBOLD};\">"
+            f"&nbsp;{html.escape(text)}&nbsp;</span>"
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_icon_type_color(item_type: str) -> str:
         """
         Retorna el color apropiado para el icono según el tipo de item
@@ -416,6 +420,7 @@ class PanelStyles:
         return colors.get(item_type, PanelStyles.TEXT_SECONDARY)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_icon_type_emoji(item_type: str) -> str:
         """
         Retorna el emoji apropiado para el tipo de item
@@ -230,6 +230,7 @@ class AreasWindow(QMainWindow):
         # Grid responsive para modo limpio (cards)
         self.clean_mode_grid = ResponsiveCardGrid()
         self.clean_mode_grid.setVisible(False)  # Oculto por defecto
+        self.clean_mode_grid.card_clicked.connect(self._copy_to_clipboard)
         layout.addWidget(self.clean_mode_grid)
 
         # Botones inferiores (solo en modo edición)
@@ -540,9 +541,6 @@ class AreasWindow(QMainWindow):
                 parent=self.clean_mode_grid
             )
 
-        # Conectar señal de click para copiar
-        card.clicked.connect(self._copy_to_clipboard)
-
         # Agregar card al grid
         self.clean_mode_grid.add_card(card)
 
@@ -7,100 +7,280 @@ Date: 2025-11-02
 import logging
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QScrollArea, QFrame
+    QPushButton, QListView, QStyledItemDelegate, QStyle, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractListModel, QModelIndex, QRect, QSize, QEvent, QTimer
+)
+from PyQt6.QtGui import QColor, QFont, QPen, QBrush, QCursor, QPixmap, QPainter
+
+from styles.effects import PanelChrome
 
 logger = logging.getLogger(__name__)
 
 
-class BookmarkItemWidget(QWidget):
-    """Widget para mostrar un marcador individual."""
+# Hoja de estilos única del panel: se parsea una sola vez al aplicarla
+_BOOKMARKS_PANEL_QSS = """
+    QLabel#bookmarksHeader {
+        color: #00d4ff;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QLabel#bookmarksEmpty {
+        color: #808080;
+        font-size: 12px;
+        padding: 20px;
+    }
+    QPushButton#bookmarksClose {
+        background-color: #ff0000;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QPushButton#bookmarksClose:hover {
+        background-color: #cc0000;
+    }
+    QListView#bookmarksList {
+        border: 1px solid #0f3460;
+        background-color: #1a1a2e;
+    }
+    QListView#bookmarksList QScrollBar:vertical {
+        background-color: #1a1a2e;
+        width: 12px;
+        border: none;
+    }
+    QListView#bookmarksList QScrollBar::handle:vertical {
+        background-color: #00d4ff;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    QListView#bookmarksList QScrollBar::handle:vertical:hover {
+        background-color: #00ff00;
+    }
+"""
+
+
+class BookmarksModel(QAbstractListModel):
+    """Modelo de lista que carga los marcadores por páginas bajo demanda."""
 
-    delete_clicked = pyqtSignal(int)  # bookmark_id
-    bookmark_clicked = pyqtSignal(str)  # url
+    IdRole = Qt.ItemDataRole.UserRole + 1
+    UrlRole = Qt.ItemDataRole.UserRole + 2
+    DisplayUrlRole = Qt.ItemDataRole.UserRole + 3
 
-    def __init__(self, bookmark_id: int, title: str, url: str, parent=None):
+    PAGE_SIZE = 100
+
+    def __init__(self, db_manager, parent=None):
         super().__init__(parent)
-        self.bookmark_id = bookmark_id
-        self.title = title
-        self.url = url
+        self.db = db_manager
+        self._bookmarks = []
+        self._total = 0
+
+    def load(self):
+        """Reinicia el modelo y carga la primera página de marcadores."""
+        self.beginResetModel()
+        self._total = self.db.count_bookmarks()
+        self._bookmarks = self.db.get_bookmarks(limit=self.PAGE_SIZE)
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return len(self._bookmarks) < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Carga la siguiente página cuando la vista llega al final."""
+        if parent.isValid():
+            return
+
+        page = self.db.get_bookmarks(limit=self.PAGE_SIZE, offset=len(self._bookmarks))
+        if not page:
+            # La tabla cambió por fuera; no seguir pidiendo páginas
+            self._total = len(self._bookmarks)
+            return
+
+        first = len(self._bookmarks)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._bookmarks.extend(page)
+        self.endInsertRows()
+
+    def total_count(self) -> int:
+        """Número total de marcadores, incluidos los aún no cargados."""
+        return self._total
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._bookmarks)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        bookmark = self._bookmarks[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return bookmark['title']
+        if role in (self.UrlRole, Qt.ItemDataRole.ToolTipRole):
+            return bookmark['url']
+        if role == self.IdRole:
+            return bookmark['id']
+        if role == self.DisplayUrlRole:
+            # URL truncada por la base de datos
+            return bookmark['display_url']
+        return None
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        """Elimina marcadores de la base de datos y del modelo."""
+        if parent.isValid() or row < 0 or count <= 0 or row + count > len(self._bookmarks):
+            return False
+
+        removed = False
+        for current in range(row + count - 1, row - 1, -1):
+            bookmark_id = self._bookmarks[current]['id']
+            if not self.db.delete_bookmark(bookmark_id):
+                continue
+
+            self.beginRemoveRows(QModelIndex(), current, current)
+            del self._bookmarks[current]
+            self._total -= 1
+            self.endRemoveRows()
+            logger.info(f"Marcador {bookmark_id} eliminado")
+            removed = True
 
-        self._setup_ui()
+        return removed
 
-    def _setup_ui(self):
-        """Configura la interfaz del widget de marcador."""
-        layout = QHBoxLayout()
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
-
-        # Contenedor para título y URL
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(2)
-
-        # Título (clickeable)
-        self.title_label = QLabel(self.title)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: #00d4ff;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QLabel:hover {
-                color: #00ff00;
-                text-decoration: underline;
-            }
-        """)
-        self.title_label.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.title_label.mousePressEvent = lambda e: self.bookmark_clicked.emit(self.url)
-        info_layout.addWidget(self.title_label)
-
-        # URL (truncada si es muy larga)
-        truncated_url = self.url[:60] + "..." if len(self.url) > 60 else self.url
-        self.url_label = QLabel(truncated_url)
-        self.url_label.setStyleSheet("""
-            QLabel {
-                color: #808080;
-                font-size: 10px;
-            }
-        """)
-        self.url_label.setToolTip(self.url)
-        info_layout.addWidget(self.url_label)
-
-        layout.addLayout(info_layout, 1)
+
+class BookmarkDelegate(QStyledItemDelegate):
+    """Dibuja cada marcador con QPainter, sin crear widgets por fila."""
+
+    ROW_HEIGHT = 50
+    DELETE_SIZE = 25
+    MARGIN = 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Recursos de pintado creados una vez y reutilizados en cada fila
+        self.title_font = QFont()
+        self.title_font.setPixelSize(12)
+        self.title_font.setBold(True)
+
+        self.title_hover_font = QFont(self.title_font)
+        self.title_hover_font.setUnderline(True)
+
+        self.card_brush = QBrush(QColor("#16213e"))
+        self.border_pen = QPen(QColor("#0f3460"), 1)
+        self.border_hover_pen = QPen(QColor("#00d4ff"), 1)
+        self.title_color = QColor("#00d4ff")
+        self.title_hover_color = QColor("#00ff00")
+        self.url_color = QColor("#808080")
+
+        self.url_font = QFont()
+        self.url_font.setPixelSize(10)
+
+        self.delete_font = QFont()
+        self.delete_font.setBold(True)
+
+        # Botón eliminar pre-renderizado (normal, hover)
+        self._delete_pixmaps = {}
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def _delete_rect(self, rect: QRect) -> QRect:
+        """Área del botón eliminar dentro de la fila."""
+        return QRect(
+            rect.right() - self.MARGIN - self.DELETE_SIZE,
+            rect.top() + (rect.height() - self.DELETE_SIZE) // 2,
+            self.DELETE_SIZE,
+            self.DELETE_SIZE
+        )
+
+    def _delete_pixmap(self, hovered: bool, device_pixel_ratio: float) -> QPixmap:
+        """Devuelve el botón eliminar rasterizado una sola vez por estado."""
+        key = (hovered, device_pixel_ratio)
+        pixmap = self._delete_pixmaps.get(key)
+        if pixmap is None:
+            size = round(self.DELETE_SIZE * device_pixel_ratio)
+            pixmap = QPixmap(size, size)
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+
+            rect = QRect(0, 0, self.DELETE_SIZE, self.DELETE_SIZE)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor("#cc0000" if hovered else "#ff0000"))
+            painter.drawRoundedRect(rect, 3, 3)
+            painter.setFont(self.delete_font)
+            painter.setPen(QColor("white"))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "✕")
+            painter.end()
+
+            self._delete_pixmaps[key] = pixmap
+        return pixmap
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        rect = option.rect
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        delete_rect = self._delete_rect(rect)
+
+        # Fondo y borde de la tarjeta
+        painter.setPen(self.border_hover_pen if hovered else self.border_pen)
+        painter.setBrush(self.card_brush)
+        painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), 5, 5)
+
+        # Título y URL
+        text_rect = QRect(
+            rect.left() + 10, rect.top() + self.MARGIN,
+            delete_rect.left() - rect.left() - 15, rect.height() - 2 * self.MARGIN
+        )
+        title_rect = text_rect.adjusted(0, 0, 0, -text_rect.height() // 2)
+        url_rect = text_rect.adjusted(0, text_rect.height() // 2, 0, 0)
+
+        painter.setFont(self.title_hover_font if hovered else self.title_font)
+        painter.setPen(self.title_hover_color if hovered else self.title_color)
+        title = painter.fontMetrics().elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole) or "",
+            Qt.TextElideMode.ElideRight,
+            title_rect.width()
+        )
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title)
+
+        painter.setFont(self.url_font)
+        painter.setPen(self.url_color)
+        painter.drawText(
+            url_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            index.data(BookmarksModel.DisplayUrlRole) or ""
+        )
 
         # Botón eliminar
-        self.delete_btn = QPushButton("✕")
-        self.delete_btn.setFixedSize(25, 25)
-        self.delete_btn.setToolTip("Eliminar marcador")
-        self.delete_btn.clicked.connect(lambda: self.delete_clicked.emit(self.bookmark_id))
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff0000;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #cc0000;
-            }
-        """)
-        layout.addWidget(self.delete_btn)
-
-        self.setLayout(layout)
-
-        # Estilo del widget
-        self.setStyleSheet("""
-            BookmarkItemWidget {
-                background-color: #16213e;
-                border: 1px solid #0f3460;
-                border-radius: 5px;
-            }
-            BookmarkItemWidget:hover {
-                border: 1px solid #00d4ff;
-            }
-        """)
+        delete_hovered = False
+        if hovered and option.widget is not None:
+            cursor_pos = option.widget.viewport().mapFromGlobal(QCursor.pos())
+            delete_hovered = delete_rect.contains(cursor_pos)
+
+        painter.drawPixmap(
+            delete_rect.topLeft(),
+            self._delete_pixmap(delete_hovered, painter.device().devicePixelRatioF())
+        )
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """Elimina el marcador al pulsar ✕; el resto de clicks llegan a la vista."""
+        if (event.type() == QEvent.Type.MouseButtonPress
+                and event.button() == Qt.MouseButton.LeftButton
+                and self._delete_rect(option.rect).contains(event.position().toPoint())):
+            model.removeRow(index.row())
+            return True
+
+        return super().editorEvent(event, model, option, index)
 
 
 class BookmarksPanel(QWidget):
@@ -120,6 +300,17 @@ class BookmarksPanel(QWidget):
         )
 
         self.setFixedSize(400, 500)
+
+        # Fondo redondeado pintado desde un pixmap cacheado (ver paintEvent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self._chrome = PanelChrome("#1a1a2e", "#00d4ff", 2, 10)
+
+        # Agrupa varias peticiones de recarga en una sola (próxima vuelta del event loop)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
         self._setup_ui()
         self._apply_styles()
 
@@ -132,132 +323,80 @@ class BookmarksPanel(QWidget):
         # Header
         header_layout = QHBoxLayout()
         header_label = QLabel("★ Marcadores")
-        header_label.setStyleSheet("""
-            QLabel {
-                color: #00d4ff;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        header_label.setObjectName("bookmarksHeader")
         header_layout.addWidget(header_label)
 
         # Botón cerrar
         close_btn = QPushButton("✕")
         close_btn.setFixedSize(30, 30)
         close_btn.setToolTip("Cerrar panel")
+        close_btn.setObjectName("bookmarksClose")
         close_btn.clicked.connect(self.close)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff0000;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #cc0000;
-            }
-        """)
         header_layout.addWidget(close_btn)
 
         main_layout.addLayout(header_layout)
 
-        # Área de scroll para los marcadores
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: 1px solid #0f3460;
-                background-color: #1a1a2e;
-            }
-            QScrollBar:vertical {
-                background-color: #1a1a2e;
-                width: 12px;
-                border: none;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #00d4ff;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #00ff00;
-            }
-        """)
-
-        # Contenedor de marcadores
-        self.bookmarks_container = QWidget()
-        self.bookmarks_container.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a2e;
-            }
-        """)
-        self.bookmarks_layout = QVBoxLayout(self.bookmarks_container)
-        self.bookmarks_layout.setSpacing(5)
-        self.bookmarks_layout.setContentsMargins(5, 5, 5, 5)
-        self.bookmarks_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-
-        scroll_area.setWidget(self.bookmarks_container)
-        main_layout.addWidget(scroll_area)
+        # Lista virtualizada de marcadores: solo se pintan las filas visibles
+        self.bookmarks_model = BookmarksModel(self.db, self)
+        self.bookmarks_delegate = BookmarkDelegate(self)
+
+        self.bookmarks_view = QListView()
+        self.bookmarks_view.setObjectName("bookmarksList")
+        self.bookmarks_view.setModel(self.bookmarks_model)
+        self.bookmarks_view.setItemDelegate(self.bookmarks_delegate)
+        self.bookmarks_view.setUniformItemSizes(True)
+        self.bookmarks_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.bookmarks_view.setSpacing(3)
+        self.bookmarks_view.setMouseTracking(True)
+        self.bookmarks_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.bookmarks_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.bookmarks_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.bookmarks_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.bookmarks_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.bookmarks_view.clicked.connect(self._on_bookmark_clicked)
+        self.bookmarks_model.rowsRemoved.connect(self._update_empty_state)
+        main_layout.addWidget(self.bookmarks_view)
+
+        # Mensaje si no hay marcadores
+        self.empty_label = QLabel("No hay marcadores guardados")
+        self.empty_label.setObjectName("bookmarksEmpty")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.hide()
+        main_layout.addWidget(self.empty_label)
 
         self.setLayout(main_layout)
 
     def _apply_styles(self):
         """Aplica estilos al panel."""
-        self.setStyleSheet("""
-            BookmarksPanel {
-                background-color: #1a1a2e;
-                border: 2px solid #00d4ff;
-                border-radius: 10px;
-            }
-        """)
+        self.setStyleSheet(_BOOKMARKS_PANEL_QSS)
+
+    def paintEvent(self, event):
+        """Pinta el marco del panel desde el pixmap cacheado."""
+        self._chrome.paint(self)
 
     def refresh_bookmarks(self):
+        """Programa la recarga de la lista de marcadores desde la base de datos."""
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
         """Recarga la lista de marcadores desde la base de datos."""
-        # Limpiar lista actual
-        while self.bookmarks_layout.count():
-            item = self.bookmarks_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Cargar marcadores
-        bookmarks = self.db.get_bookmarks()
-
-        if not bookmarks:
-            # Mostrar mensaje si no hay marcadores
-            no_bookmarks_label = QLabel("No hay marcadores guardados")
-            no_bookmarks_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_bookmarks_label.setStyleSheet("""
-                QLabel {
-                    color: #808080;
-                    font-size: 12px;
-                    padding: 20px;
-                }
-            """)
-            self.bookmarks_layout.addWidget(no_bookmarks_label)
-        else:
-            # Agregar widgets de marcadores
-            for bookmark in bookmarks:
-                bookmark_widget = BookmarkItemWidget(
-                    bookmark['id'],
-                    bookmark['title'],
-                    bookmark['url']
-                )
-                bookmark_widget.bookmark_clicked.connect(self._on_bookmark_clicked)
-                bookmark_widget.delete_clicked.connect(self._on_delete_bookmark)
-                self.bookmarks_layout.addWidget(bookmark_widget)
-
-        logger.info(f"Panel de marcadores actualizado: {len(bookmarks)} marcadores")
-
-    def _on_bookmark_clicked(self, url: str):
+        # Un único reset del modelo y un único repintado al final
+        self.setUpdatesEnabled(False)
+        try:
+            self.bookmarks_model.load()
+            self._update_empty_state()
+        finally:
+            self.setUpdatesEnabled(True)
+
+        logger.info(f"Panel de marcadores actualizado: {self.bookmarks_model.total_count()} marcadores")
+
+    def _update_empty_state(self):
+        """Alterna entre la lista y el mensaje de lista vacía."""
+        has_bookmarks = self.bookmarks_model.total_count() > 0
+        self.bookmarks_view.setVisible(has_bookmarks)
+        self.empty_label.setVisible(not has_bookmarks)
+
+    def _on_bookmark_clicked(self, index: QModelIndex):
         """Handler cuando se hace click en un marcador."""
-        self.bookmark_selected.emit(url)
+        self.bookmark_selected.emit(index.data(BookmarksModel.UrlRole))
         self.close()
-
-    def _on_delete_bookmark(self, bookmark_id: int):
-        """Handler cuando se elimina un marcador."""
-        if self.db.delete_bookmark(bookmark_id):
-            logger.info(f"Marcador {bookmark_id} eliminado")
-            self.refresh_bookmarks()
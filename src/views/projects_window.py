@@ -21,7 +21,7 @@ from src.core.project_export_manager import ProjectExportManager
 from src.database.db_manager import DBManager
 from src.views.widgets.project_relation_widget import ProjectRelationWidget
 from src.views.widgets.project_component_widget import ProjectComponentWidget
-from src.views.widgets.project_card_widget import ProjectCardWidget
+from src.views.widgets.project_card_widget import ProjectCardWidget, prepare_card_records
 from src.views.widgets.responsive_card_grid import ResponsiveCardGrid
 
 logger = logging.getLogger(__name__)
@@ -230,6 +230,7 @@ class ProjectsWindow(QMainWindow):
         # Grid responsive para modo limpio (cards)
         self.clean_mode_grid = ResponsiveCardGrid()
         self.clean_mode_grid.setVisible(False)  # Oculto por defecto
+        self.clean_mode_grid.card_clicked.connect(self._copy_to_clipboard)
         layout.addWidget(self.clean_mode_grid)
 
         # Botones inferiores (solo en modo edición)
@@ -413,9 +414,10 @@ class ProjectsWindow(QMainWindow):
                 else:  # component
                     self._add_component_widget(item)
         else:
-            # Modo limpio: usar cards en grid
-            for item in content:
-                self._add_card_widget(item)
+            # Modo limpio: usar cards en grid (campos de texto preparados en una pasada)
+            sources = [source for source in map(self._card_source, content) if source]
+            for record in prepare_card_records(sources):
+                self._add_card_widget(record)
 
     def _clear_canvas(self):
         """Limpia el canvas eliminando todos los widgets"""
@@ -477,8 +479,13 @@ class ProjectsWindow(QMainWindow):
 
         self.canvas_layout.insertWidget(self.canvas_layout.count() - 1, widget)
 
-    def _add_card_widget(self, item):
-        """Agrega una card al grid (modo limpio)"""
+    def _card_source(self, item):
+        """
+        Obtiene los datos de la card de un elemento (modo limpio)
+
+        Returns:
+            (item_data, item_type) o None si el elemento no se muestra
+        """
         # Determinar tipo de elemento
         if item.get('entity_type'):
             # Es una relación (tag, item, category, list, table, process)
@@ -502,12 +509,7 @@ class ProjectsWindow(QMainWindow):
                 tags = [create_tag_from_db_row(tag_data) for tag_data in tags_data]
                 metadata['tags'] = tags
 
-            # Crear card
-            card = ProjectCardWidget(
-                item_data=metadata,
-                item_type=entity_type,
-                parent=self.clean_mode_grid
-            )
+            return metadata, entity_type
 
         else:
             # Es un componente (comment, alert, note, divider)
@@ -515,7 +517,7 @@ class ProjectsWindow(QMainWindow):
 
             # Saltar divisores en modo limpio (no tienen sentido en grid)
             if component_type == 'divider':
-                return
+                return None
 
             # Preparar datos para la card
             card_data = {
@@ -533,15 +535,11 @@ class ProjectsWindow(QMainWindow):
                 tags = [create_tag_from_db_row(tag_data) for tag_data in tags_data]
                 card_data['tags'] = tags
 
-            # Crear card
-            card = ProjectCardWidget(
-                item_data=card_data,
-                item_type=component_type,
-                parent=self.clean_mode_grid
-            )
+            return card_data, component_type
 
-        # Conectar señal de click para copiar
-        card.clicked.connect(self._copy_to_clipboard)
+    def _add_card_widget(self, record):
+        """Agrega una card al grid (modo limpio)"""
+        card = ProjectCardWidget(record, parent=self.clean_mode_grid)
 
         # Agregar card al grid
         self.clean_mode_grid.add_card(card)
@@ -9,42 +9,99 @@ Shows buttons for:
 - Browser (🌐)
 - Category Filter (📂)
 """
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton, QLabel
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton, QLabel
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QCursor
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from styles.effects import PanelChrome
+
+
+# Single panel stylesheet, parsed once and inherited by every child button
+_QUICK_ACCESS_QSS = """
+    QLabel#quickAccessHeader {
+        color: #ffffff;
+        font-size: 11pt;
+        font-weight: bold;
+        background-color: transparent;
+        padding: 5px;
+    }
+    QPushButton#quickAccessSmallClose {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        font-size: 10pt;
+        font-weight: bold;
+    }
+    QPushButton#quickAccessSmallClose:hover {
+        background-color: #e4475b;
+        border-color: #e4475b;
+    }
+    QPushButton#quickAccessAction {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        font-size: 10pt;
+        text-align: left;
+        padding-left: 10px;
+    }
+    QPushButton#quickAccessAction:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #00ff88,
+            stop:1 #00ccff
+        );
+        border-color: #00ff88;
+    }
+    QPushButton#quickAccessAction:pressed {
+        background-color: #1d1d1d;
+    }
+    QPushButton#quickAccessClose {
+        background-color: #3d3d3d;
+        color: #ffffff;
+        border: 1px solid #4d4d4d;
+        border-radius: 4px;
+        font-size: 10pt;
+        font-weight: bold;
+        text-align: center;
+    }
+    QPushButton#quickAccessClose:hover {
+        background-color: #e4475b;
+        border-color: #e4475b;
+    }
+    QPushButton#quickAccessClose:pressed {
+        background-color: #c03545;
+    }
+"""
+
+_POINTER_CURSOR = None
+
+
+def _pointer_cursor() -> QCursor:
+    """Shared pointing-hand cursor, built once after QApplication exists"""
+    global _POINTER_CURSOR
+    if _POINTER_CURSOR is None:
+        _POINTER_CURSOR = QCursor(Qt.CursorShape.PointingHandCursor)
+    return _POINTER_CURSOR
 
 
 class QuickAccessPanel(QWidget):
     """Small floating panel with quick access buttons"""
 
-    # Signals for each action
-    stats_clicked = pyqtSignal()
-    tables_manager_clicked = pyqtSignal()
-    favorites_clicked = pyqtSignal()
-    dashboard_clicked = pyqtSignal()
-    browser_clicked = pyqtSignal()
-    category_filter_clicked = pyqtSignal()
-    category_manager_clicked = pyqtSignal()  # NEW: Gestión de categorías
-    table_creator_clicked = pyqtSignal()
-    create_process_clicked = pyqtSignal()
-    view_processes_clicked = pyqtSignal()
-    ai_bulk_clicked = pyqtSignal()
-    ai_table_clicked = pyqtSignal()
-    pinned_panels_clicked = pyqtSignal()
-    advanced_search_clicked = pyqtSignal()
-    component_manager_clicked = pyqtSignal()
-    web_static_create_clicked = pyqtSignal()
-    image_gallery_clicked = pyqtSignal()  # NEW: Image Gallery
-    projects_clicked = pyqtSignal()  # NEW: Projects Manager
-    areas_clicked = pyqtSignal()  # NEW: Areas Manager
-    close_app_clicked = pyqtSignal()  # NEW: Close application
+    # Emitted with the action key of the clicked button (see buttons_config,
+    # plus "close_app" for the bottom close button)
+    action_triggered = pyqtSignal(str)
 
     def __init__(self, parent=None):
         super().__init__(parent)
+
+        # Primary screen available geometry, cached until the screen changes
+        self._screen = None
+        self._screen_geom = None
+        QApplication.instance().primaryScreenChanged.connect(self._watch_screen)
+        self._watch_screen(QApplication.primaryScreen())
+
         self.init_ui()
 
     def init_ui(self):
@@ -60,20 +117,17 @@ class QuickAccessPanel(QWidget):
         # Fixed size for panel (adjusted for vertical layout)
         self.setFixedSize(220, 750)
 
-        # Window opacity
-        self.setWindowOpacity(0.95)
-
         # Don't close app when closing this window
         self.setAttribute(Qt.WidgetAttribute.WA_QuitOnClose, False)
 
-        # Styling
-        self.setStyleSheet("""
-            QuickAccessPanel {
-                background-color: #1e1e1e;
-                border: 2px solid #00ff88;
-                border-radius: 8px;
-            }
-        """)
+        # Panel is reused across shows: closing only hides it
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, False)
+
+        # Styling: rounded chrome painted from a cached pixmap (see paintEvent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        # Background at 95% alpha (#AARRGGBB) instead of window-level opacity
+        self._chrome = PanelChrome("#f21e1e1e", "#00ff88", 2, 8)
+        self.setStyleSheet(_QUICK_ACCESS_QSS)
 
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -86,65 +140,44 @@ class QuickAccessPanel(QWidget):
         header_layout.setContentsMargins(0, 0, 0, 0)
 
         header = QLabel("☰ Menu")
-        header.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 11pt;
-                font-weight: bold;
-                background-color: transparent;
-                padding: 5px;
-            }
-        """)
+        header.setObjectName("quickAccessHeader")
         header_layout.addWidget(header)
 
         # Small close button (only closes the Menu panel)
         small_close_btn = QPushButton("✕")
         small_close_btn.setFixedSize(25, 25)
-        small_close_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        small_close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                font-size: 10pt;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e4475b;
-                border-color: #e4475b;
-            }
-        """)
+        small_close_btn.setCursor(_pointer_cursor())
+        small_close_btn.setObjectName("quickAccessSmallClose")
         small_close_btn.clicked.connect(self.hide)
         header_layout.addWidget(small_close_btn)
 
         main_layout.addLayout(header_layout)
 
-        # Buttons config (icon, label, handler)
+        # Buttons config (icon, label, action key)
         buttons_config = [
-            ("🔍⚡", "Búsqueda Avanzada", self.on_advanced_search_clicked),
-            ("📁", "Proyectos", self.on_projects_clicked),  # NEW: Projects Manager
-            ("🏢", "Áreas", self.on_areas_clicked),  # NEW: Areas Manager
-            ("🖼️", "Galería de Imágenes", self.on_image_gallery_clicked),
-            ("🤖", "IA Bulk", self.on_ai_bulk_clicked),
-            ("🤖📊", "IA Tabla", self.on_ai_table_clicked),
-            ("⚙️➕", "Crear Proceso", self.on_create_process_clicked),
-            ("⚙️📋", "Ver Procesos", self.on_view_processes_clicked),
-            ("📊", "Crear Tabla", self.on_table_creator_clicked),
-            ("📋", "Gestor de Tablas", self.on_tables_manager_clicked),
-            ("📱", "Web Estático", self.on_web_static_create_clicked),
-            ("⭐", "Favoritos", self.on_favorites_clicked),
-            ("📊", "Estadísticas", self.on_stats_clicked),
-            ("🧩", "Componentes", self.on_component_manager_clicked),
-            ("📂", "Categorías", self.on_category_manager_clicked),
-            ("📁", "Filtros", self.on_category_filter_clicked),
-            ("🗂️", "Dashboard", self.on_dashboard_clicked),
-            ("📌", "Paneles Anclados", self.on_pinned_panels_clicked),
+            ("🔍⚡", "Búsqueda Avanzada", "advanced_search"),
+            ("📁", "Proyectos", "projects"),  # NEW: Projects Manager
+            ("🏢", "Áreas", "areas"),  # NEW: Areas Manager
+            ("🖼️", "Galería de Imágenes", "image_gallery"),
+            ("🤖", "IA Bulk", "ai_bulk"),
+            ("🤖📊", "IA Tabla", "ai_table"),
+            ("⚙️➕", "Crear Proceso", "create_process"),
+            ("⚙️📋", "Ver Procesos", "view_processes"),
+            ("📊", "Crear Tabla", "table_creator"),
+            ("📋", "Gestor de Tablas", "tables_manager"),
+            ("📱", "Web Estático", "web_static_create"),
+            ("⭐", "Favoritos", "favorites"),
+            ("📊", "Estadísticas", "stats"),
+            ("🧩", "Componentes", "component_manager"),
+            ("📂", "Categorías", "category_manager"),
+            ("📁", "Filtros", "category_filter"),
+            ("🗂️", "Dashboard", "dashboard"),
+            ("📌", "Paneles Anclados", "pinned_panels"),
         ]
 
         # Create buttons in rows
-        for icon, label, handler in buttons_config:
-            row_widget = self.create_action_row(icon, label, handler)
+        for icon, label, action in buttons_config:
+            row_widget = self.create_action_row(icon, label, action)
             main_layout.addWidget(row_widget)
 
         # Add spacer to push close button to bottom
@@ -153,158 +186,49 @@ class QuickAccessPanel(QWidget):
         # Close button at the bottom
         close_btn = QPushButton("✕  Cerrar")
         close_btn.setFixedHeight(40)
-        close_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: 1px solid #4d4d4d;
-                border-radius: 4px;
-                font-size: 10pt;
-                font-weight: bold;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: #e4475b;
-                border-color: #e4475b;
-            }
-            QPushButton:pressed {
-                background-color: #c03545;
-            }
-        """)
-        close_btn.clicked.connect(self.on_close_clicked)
+        close_btn.setCursor(_pointer_cursor())
+        close_btn.setObjectName("quickAccessClose")
+        close_btn.setProperty("action", "close_app")
+        close_btn.clicked.connect(self._emit_action)
         main_layout.addWidget(close_btn)
 
-    def create_action_row(self, icon: str, label: str, handler):
+    def paintEvent(self, event):
+        """Paint the panel chrome from the cached pixmap"""
+        self._chrome.paint(self)
+
+    def create_action_row(self, icon: str, label: str, action: str):
         """Create a button with icon and text"""
         # Button with icon and text
         button = QPushButton(f"{icon}  {label}")
         button.setFixedHeight(36)
-        button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                font-size: 10pt;
-                text-align: left;
-                padding-left: 10px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #00ff88,
-                    stop:1 #00ccff
-                );
-                border-color: #00ff88;
-            }
-            QPushButton:pressed {
-                background-color: #1d1d1d;
-            }
-        """)
-        button.clicked.connect(handler)
+        button.setCursor(_pointer_cursor())
+        button.setObjectName("quickAccessAction")
+        button.setProperty("action", action)
+        button.clicked.connect(self._emit_action)
         return button
 
     # Handlers
-    def on_table_creator_clicked(self):
-        """Handle table creator button click"""
-        self.table_creator_clicked.emit()
-        self.hide()
-
-    def on_tables_manager_clicked(self):
-        """Handle tables manager button click"""
-        self.tables_manager_clicked.emit()
-        self.hide()
-
-    def on_favorites_clicked(self):
-        """Handle favorites button click"""
-        self.favorites_clicked.emit()
-        self.hide()
-
-    def on_stats_clicked(self):
-        """Handle stats button click"""
-        self.stats_clicked.emit()
-        self.hide()
-
-    def on_browser_clicked(self):
-        """Handle browser button click"""
-        self.browser_clicked.emit()
-        self.hide()
-
-    def on_category_filter_clicked(self):
-        """Handle category filter button click"""
-        self.category_filter_clicked.emit()
-        self.hide()
-
-    def on_category_manager_clicked(self):
-        """Handle category manager button click"""
-        self.category_manager_clicked.emit()
-        self.hide()
-
-    def on_dashboard_clicked(self):
-        """Handle dashboard button click"""
-        self.dashboard_clicked.emit()
-        self.hide()
-
-    def on_create_process_clicked(self):
-        """Handle create process button click"""
-        self.create_process_clicked.emit()
-        self.hide()
-
-    def on_view_processes_clicked(self):
-        """Handle view processes button click"""
-        self.view_processes_clicked.emit()
-        self.hide()
-
-    def on_ai_bulk_clicked(self):
-        """Handle AI bulk creation button click"""
-        self.ai_bulk_clicked.emit()
-        self.hide()
-
-    def on_ai_table_clicked(self):
-        """Handle AI table creation button click"""
-        self.ai_table_clicked.emit()
-        self.hide()
-
-    def on_pinned_panels_clicked(self):
-        """Handle pinned panels manager button click"""
-        self.pinned_panels_clicked.emit()
+    def _emit_action(self):
+        """Handle any action button click: emit its action key and hide"""
+        self.action_triggered.emit(self.sender().property("action"))
         self.hide()
 
-    def on_advanced_search_clicked(self):
-        """Handle advanced search button click"""
-        self.advanced_search_clicked.emit()
-        self.hide()
-
-    def on_component_manager_clicked(self):
-        """Handle component manager button click"""
-        self.component_manager_clicked.emit()
-        self.hide()
+    def _watch_screen(self, screen):
+        """Track the primary screen and drop the cached geometry"""
+        if self._screen is not None:
+            try:
+                self._screen.availableGeometryChanged.disconnect(self._invalidate_screen_cache)
+            except (TypeError, RuntimeError):
+                pass  # Old screen already removed
 
-    def on_web_static_create_clicked(self):
-        """Handle web static create button click"""
-        self.web_static_create_clicked.emit()
-        self.hide()
+        self._screen = screen
+        if screen is not None:
+            screen.availableGeometryChanged.connect(self._invalidate_screen_cache)
+        self._invalidate_screen_cache()
 
-    def on_image_gallery_clicked(self):
-        """Handle image gallery button click"""
-        self.image_gallery_clicked.emit()
-        self.hide()
-
-    def on_projects_clicked(self):
-        """Handle projects button click"""
-        self.projects_clicked.emit()
-        self.hide()
-
-    def on_areas_clicked(self):
-        """Handle areas button click"""
-        self.areas_clicked.emit()
-        self.hide()
-
-    def on_close_clicked(self):
-        """Handle close button click - closes the application"""
-        self.close_app_clicked.emit()
+    def _invalidate_screen_cache(self):
+        """Forget the cached screen geometry"""
+        self._screen_geom = None
 
     def position_near_button(self, button_widget):
         """Position panel near the quick access button"""
@@ -318,12 +242,12 @@ class QuickAccessPanel(QWidget):
         panel_x = button_pos.x() - self.width() - 10
 
         # Position panel higher up (align with top of screen with margin)
-        from PyQt6.QtWidgets import QApplication
-        screen = QApplication.primaryScreen()
-        if screen:
-            screen_geom = screen.availableGeometry()
+        if self._screen_geom is None and self._screen is not None:
+            self._screen_geom = self._screen.availableGeometry()
+
+        if self._screen_geom is not None:
             # Position at top with small margin
-            panel_y = screen_geom.top() + 50
+            panel_y = self._screen_geom.top() + 50
         else:
             # Fallback: align with button but offset upwards
             panel_y = max(50, button_pos.y() - 200)
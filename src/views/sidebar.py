@@ -110,6 +110,7 @@ class Sidebar(QWidget):
         self.theme = get_theme()  # Obtener tema futurista
         self.notebook_window = None  # Reference to notebook window
         self.controller = None  # Will be set later
+        self.quick_access_panel = None  # Built once on first use, then shown/hidden
 
         # Process buttons
         self.process_buttons = {}  # Dict: process_id -> ProcessButton
@@ -615,7 +616,7 @@ class Sidebar(QWidget):
                 continue
 
             button = CategoryButton(category.id, category.name)
-            button.clicked.connect(lambda checked, cat_id=category.id: self.on_category_clicked(cat_id))
+            button.clicked.connect(self.on_category_button_clicked)
 
             self.category_buttons[category.id] = button
             # Insert before the stretch
@@ -706,6 +707,10 @@ class Sidebar(QWidget):
             self.active_process_button.set_active(False)
             self.active_process_button = None
 
+    def on_category_button_clicked(self):
+        """Handle click from any category button (shared slot, no per-button closure)"""
+        self.on_category_clicked(self.sender().category_id)
+
     def on_category_clicked(self, category_id: str):
         """Handle category button click"""
         # Update active button
@@ -808,31 +813,13 @@ class Sidebar(QWidget):
 
     def on_quick_access_clicked(self):
         """Handle quick access button click - show/hide quick access panel"""
-        if not hasattr(self, 'quick_access_panel') or self.quick_access_panel is None:
+        if self.quick_access_panel is None:
             from views.quick_access_panel import QuickAccessPanel
             self.quick_access_panel = QuickAccessPanel(self)
 
             # Connect signals if controller is available
             if self.controller:
-                self.quick_access_panel.advanced_search_clicked.connect(lambda: self.advanced_search_clicked.emit())
-                self.quick_access_panel.stats_clicked.connect(lambda: self.stats_clicked.emit())
-                self.quick_access_panel.tables_manager_clicked.connect(lambda: self.tables_manager_clicked.emit())
-                self.quick_access_panel.favorites_clicked.connect(lambda: self.favorites_clicked.emit())
-                self.quick_access_panel.dashboard_clicked.connect(lambda: self.dashboard_clicked.emit())
-                self.quick_access_panel.category_filter_clicked.connect(lambda: self.category_filter_clicked.emit())
-                self.quick_access_panel.category_manager_clicked.connect(lambda: self.category_manager_clicked.emit())  # NEW
-                self.quick_access_panel.table_creator_clicked.connect(lambda: self.table_creator_clicked.emit())
-                self.quick_access_panel.create_process_clicked.connect(lambda: self.create_process_clicked.emit())
-                self.quick_access_panel.view_processes_clicked.connect(lambda: self.view_processes_clicked.emit())
-                self.quick_access_panel.ai_bulk_clicked.connect(lambda: self.ai_bulk_clicked.emit())
-                self.quick_access_panel.ai_table_clicked.connect(lambda: self.ai_table_clicked.emit())
-                self.quick_access_panel.pinned_panels_clicked.connect(lambda: self.pinned_panels_manager_clicked.emit())
-                self.quick_access_panel.component_manager_clicked.connect(lambda: self.component_manager_clicked.emit())
-                self.quick_access_panel.web_static_create_clicked.connect(lambda: self.web_static_create_clicked.emit())
-                self.quick_access_panel.image_gallery_clicked.connect(lambda: self.image_gallery_clicked.emit())
-                self.quick_access_panel.projects_clicked.connect(lambda: self.projects_clicked.emit())
-                self.quick_access_panel.areas_clicked.connect(lambda: self.areas_clicked.emit())
-                self.quick_access_panel.close_app_clicked.connect(lambda: self.close_app_requested.emit())
+                self.quick_access_panel.action_triggered.connect(self.on_quick_access_action)
 
         # Toggle visibility
         if self.quick_access_panel.isVisible():
@@ -841,6 +828,33 @@ class Sidebar(QWidget):
             self.quick_access_panel.position_near_button(self.quick_access_button)
             self.quick_access_panel.show()
 
+    def on_quick_access_action(self, action: str):
+        """Forward a quick access panel action to the matching sidebar signal"""
+        signals = {
+            "advanced_search": self.advanced_search_clicked,
+            "projects": self.projects_clicked,
+            "areas": self.areas_clicked,
+            "image_gallery": self.image_gallery_clicked,
+            "ai_bulk": self.ai_bulk_clicked,
+            "ai_table": self.ai_table_clicked,
+            "create_process": self.create_process_clicked,
+            "view_processes": self.view_processes_clicked,
+            "table_creator": self.table_creator_clicked,
+            "tables_manager": self.tables_manager_clicked,
+            "web_static_create": self.web_static_create_clicked,
+            "favorites": self.favorites_clicked,
+            "stats": self.stats_clicked,
+            "component_manager": self.component_manager_clicked,
+            "category_manager": self.category_manager_clicked,
+            "category_filter": self.category_filter_clicked,
+            "dashboard": self.dashboard_clicked,
+            "pinned_panels": self.pinned_panels_manager_clicked,
+            "close_app": self.close_app_requested,
+        }
+        signal = signals.get(action)
+        if signal is not None:
+            signal.emit()
+
     def on_pinned_panels_manager_clicked(self):
         """Handle pinned panels manager button click"""
         self.pinned_panels_manager_clicked.emit()
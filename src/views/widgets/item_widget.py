@@ -1,17 +1,21 @@
 """
 Item Button Widget
 """
-from PyQt6.QtWidgets import QPushButton, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QFrame, QSizePolicy
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer
-from PyQt6.QtGui import QFont
-import sys
+from PyQt6.QtWidgets import QPushButton, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QFrame, QSizePolicy, QToolTip
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, pyqtProperty, QSize, QTimer, QEvent, QObject, QRunnable, QThreadPool, QRectF,
+    QProcess, QPropertyAnimation
+)
+from PyQt6.QtGui import QFont, QPixmap, QPainter, QColor, QIcon, QGuiApplication
+from PyQt6 import sip
 import webbrowser
+import pyperclip
 import os
+import stat
 import subprocess
 import platform
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from models.item import Item, ItemType
 from core.usage_tracker import UsageTracker
 from core.favorites_manager import FavoritesManager
@@ -22,9 +26,568 @@ from views.dialogs.item_details_dialog import ItemDetailsDialog
 from styles.panel_styles import PanelStyles
 import time
 import logging
+import functools
+import contextlib
+import threading
+import locale
+import weakref
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Base de datos de la aplicación (raíz del proyecto)
+_DB_PATH = Path(__file__).resolve().parents[3] / "widget_sidebar.db"
+
+# FileManager compartido para resolver rutas relativas (se crea bajo demanda)
+_file_manager = None
+_file_manager_lock = threading.Lock()
+
+
+def _get_file_manager() -> FileManager:
+    """Retorna el FileManager compartido, creándolo la primera vez"""
+    global _file_manager
+    if _file_manager is None:
+        with _file_manager_lock:
+            if _file_manager is None:
+                _file_manager = FileManager(ConfigManager(str(_DB_PATH)))
+    return _file_manager
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_relative_path(content_path: str) -> Path:
+    """Construye la ruta absoluta de una ruta relativa (lanza excepción si no es posible)"""
+    return Path(_get_file_manager().get_absolute_path(content_path))
+
+
+def _resolve_path(content_path: str) -> Path:
+    """
+    Resuelve una ruta, convirtiendo rutas relativas a absolutas si es necesario
+
+    Args:
+        content_path: Ruta desde item.content (puede ser relativa o absoluta)
+
+    Returns:
+        Path: Ruta absoluta resuelta
+    """
+    # Rutas absolutas: no se necesita consultar la configuración
+    if os.path.isabs(content_path):
+        return Path(content_path)
+
+    # Formato relativo: "IMAGENES/test.jpg" o "IMAGENES\test.jpg"
+    try:
+        return _resolve_relative_path(content_path)
+    except Exception as e:
+        logger.warning(f"Could not resolve relative path '{content_path}': {e}")
+        # Fallback: asumir que es ruta absoluta
+        return Path(content_path)
+
+
+def _action_button_style(variant: str, background: str, hover: str, pressed: str,
+                         color: str = "#ffffff", hover_color: str = None) -> str:
+    """Construye las reglas QSS de una variante de botón de acción"""
+    selector = f'QPushButton[variant="{variant}"]'
+    hover_color_rule = f"color: {hover_color};" if hover_color else ""
+    return f"""
+        {selector} {{
+            background-color: {background};
+            color: {color};
+            border: none;
+            border-radius: 3px;
+            font-size: 12pt;
+            padding: 0px;
+        }}
+        {selector}:hover {{
+            background-color: {hover};
+            {hover_color_rule}
+        }}
+        {selector}:pressed {{
+            background-color: {pressed};
+        }}
+    """
+
+
+_FLASH_DURATION_MS = 300  # Destello verde de los botones de acción
+_FLASH_COLOR = QColor("#00ff00")
+
+
+# Emojis/glifos pre-renderizados: (glifo, tamaño, color, fondo, caja, dpr) -> QPixmap
+_glyph_pixmaps = {}
+
+
+def _glyph_pixmap(glyph: str, size: int, color: str = "#ffffff",
+                  background: str = None, box: int = None) -> QPixmap:
+    """
+    Renderiza un emoji/glifo en un QPixmap una sola vez y lo reutiliza
+
+    Con background, el glifo se centra sobre un rectángulo redondeado de
+    box x box (usado para los estados de los botones de acción).
+    """
+    box = box or size
+    dpr = QGuiApplication.instance().devicePixelRatio()
+    key = (glyph, size, color, background, box, dpr)
+    pixmap = _glyph_pixmaps.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(round(box * dpr), round(box * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        rect = QRectF(0, 0, box, box)
+        if background:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(background))
+            painter.drawRoundedRect(rect, 3, 3)
+        font = QFont()
+        font.setPixelSize(size)
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, glyph)
+        painter.end()
+        _glyph_pixmaps[key] = pixmap
+    return pixmap
+
+
+class ActionButton(QPushButton):
+    """Botón de acción compacto (28x28) cuyo estilo depende de la propiedad 'variant'"""
+
+    # Reglas de todas las variantes; se incluyen en el stylesheet del ItemButton
+    # contenedor, así los botones no tienen stylesheet propio
+    STYLE = "".join([
+        _action_button_style(
+            "execute", PanelStyles.ACCENT_WARNING, PanelStyles.ACCENT_HOVER, PanelStyles.ACCENT_SUBTLE,
+            color="#000000", hover_color="#ffffff"
+        ),
+        _action_button_style("render", "#4CAF50", "#45a049", "#388E3C"),
+        _action_button_style("open_url", "#007acc", "#005a9e", "#004578"),
+        _action_button_style("open_external", "#0078d4", "#106ebe", "#005a9e"),
+        _action_button_style("open_explorer", "#2d7d2d", "#236123", "#1a4a1a"),
+        _action_button_style("open_file", "#cc7a00", "#9e5e00", "#784500"),
+        _action_button_style("view_table", "#007acc", "#005a9e", "#004578"),
+        _action_button_style("reveal", "#cc0000", "#9e0000", "#780000"),
+        """
+        QPushButton[variant="info"] {
+            background-color: transparent;
+            border: none;
+            font-size: 12pt;
+            padding: 0px;
+        }
+        QPushButton[variant="info"]:hover {
+            background-color: #3e3e42;
+            border-radius: 3px;
+        }
+        """,
+    ])
+
+    GLYPH_SIZE = 16  # 12pt
+    BUTTON_SIZE = 28
+    # Color de los glifos monocromos (por defecto blanco)
+    GLYPH_COLORS = {"execute": "#000000"}
+    # Estados temporales (ejecutar/renderizar): estado -> (fondo, color del glifo)
+    STATE_COLORS = {
+        "running": ("#ffff00", "#000000"),
+        "ok": ("#00ff00", "#000000"),
+        "error": ("#ff0000", "#ffffff"),
+        "render_active": ("#00d4ff", "#000000"),
+        "render_error": ("#f44336", "#ffffff"),
+    }
+
+    def __init__(self, glyph: str, variant: str, tooltip: str = "", parent=None):
+        super().__init__(parent)
+        self.setProperty("variant", variant)
+        self.setFixedSize(self.BUTTON_SIZE, self.BUTTON_SIZE)
+        self.setIconSize(QSize(self.GLYPH_SIZE, self.GLYPH_SIZE))
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setToolTip(tooltip)
+        self._flash_color = QColor(Qt.GlobalColor.transparent)
+        self._flash_animation = None  # Created on the first flash
+        self.set_glyph(glyph)
+
+    def set_glyph(self, glyph: str):
+        """Muestra el glifo como icono pre-renderizado (en lugar de texto)"""
+        self._glyph = glyph
+        color = self.GLYPH_COLORS.get(self.property("variant"), "#ffffff")
+        self.setIconSize(QSize(self.GLYPH_SIZE, self.GLYPH_SIZE))
+        self.setIcon(QIcon(_glyph_pixmap(glyph, self.GLYPH_SIZE, color)))
+
+    def set_state(self, state: str, glyph: str = None):
+        """
+        Muestra un estado temporal (running/ok/error...) cambiando solo el
+        icono: un pixmap pre-renderizado que cubre el botón con el color del
+        estado, sin tocar el stylesheet
+        """
+        background, color = self.STATE_COLORS[state]
+        self.setIconSize(QSize(self.BUTTON_SIZE, self.BUTTON_SIZE))
+        self.setIcon(QIcon(_glyph_pixmap(
+            glyph or self._glyph, self.GLYPH_SIZE, color, background, self.BUTTON_SIZE
+        )))
+
+    def clear_state(self):
+        """Vuelve al glifo normal del botón"""
+        self.set_glyph(self._glyph)
+
+    def _get_flash_color(self) -> QColor:
+        return self._flash_color
+
+    def _set_flash_color(self, color: QColor):
+        self._flash_color = color
+        self.update()
+
+    # Color del destello, animado por QPropertyAnimation
+    flashColor = pyqtProperty(QColor, fget=_get_flash_color, fset=_set_flash_color)
+
+    def flash(self):
+        """Destello verde que se desvanece (feedback de acción realizada)"""
+        if self._flash_animation is None:
+            faded = QColor(_FLASH_COLOR)
+            faded.setAlpha(0)
+            self._flash_animation = QPropertyAnimation(self, b"flashColor", self)
+            self._flash_animation.setDuration(_FLASH_DURATION_MS)
+            self._flash_animation.setStartValue(_FLASH_COLOR)
+            self._flash_animation.setKeyValueAt(0.7, _FLASH_COLOR)
+            self._flash_animation.setEndValue(faded)
+        self._flash_animation.stop()
+        self._flash_animation.start()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._flash_color.alpha():
+            # Destello: fondo del color animado con el glifo encima
+            painter = QPainter(self)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._flash_color)
+            painter.drawRoundedRect(QRectF(self.rect()), 3, 3)
+            self.icon().paint(painter, self.rect())
+            painter.end()
+
+
+def _frame_state_style(state: str, background: str, border_bottom: str,
+                       border_left: str = None, hover: str = None) -> str:
+    """Construye las reglas QSS del frame de un ItemButton para un estado"""
+    selector = f'ItemButton[state="{state}"]'
+    border_left_rule = f"border-left: 3px solid {border_left};" if border_left else ""
+    hover_rule = f"{selector}:hover {{ background-color: {hover}; }}" if hover else ""
+    return f"""
+        {selector} {{
+            background-color: {background};
+            border: none;
+            {border_left_rule}
+            border-bottom: 1px solid {border_bottom};
+        }}
+        {hover_rule}
+    """
+
+
+# Stylesheet único de todos los ItemButton: los estados (copiado, sensible,
+# con archivo guardado...) se seleccionan con propiedades dinámicas, así que
+# cambiar de estado no vuelve a parsear QSS
+_ITEM_STYLESHEET = "".join([
+    _frame_state_style("normal", "#2d2d2d", "#1e1e1e", hover="#3d3d3d"),
+    _frame_state_style("path_saved", "#2d2d2d", "#1e1e1e", border_left="#4CAF50", hover="#3d3d3d"),
+    _frame_state_style("sensitive", "#3d2020", "#1e1e1e", border_left="#cc0000", hover="#4d2525"),
+    _frame_state_style("copied", "#007acc", "#005a9e"),
+    _frame_state_style("copied_sensitive", "#cc7a00", "#9e5e00"),
+    """
+        ItemButton QLabel {
+            color: #cccccc;
+            background-color: transparent;
+            border: none;
+        }
+        ItemButton[state="copied"] QLabel,
+        ItemButton[state="copied_sensitive"] QLabel {
+            color: #ffffff;
+            font-weight: bold;
+        }
+        QLabel#itemTypeIcon {
+            background: transparent;
+            border: none;
+            padding: 0px;
+        }
+    """,
+    PanelStyles.get_item_label_style("QLabel#itemLabel"),
+    ActionButton.STYLE,
+])
+
+
+# Estado del frame según (sensible, PATH con archivo guardado); los sensibles
+# tienen prioridad
+_BASE_STATES = {
+    (False, False): "normal",
+    (False, True): "path_saved",
+    (True, False): "sensitive",
+    (True, True): "sensitive",
+}
+# Estado de feedback de copiado según si el item es sensible
+_COPIED_STATES = {False: "copied", True: "copied_sensitive"}
+
+
+def _set_state_property(widget: QWidget, name: str, value):
+    """Cambia una propiedad dinámica usada por el QSS y re-aplica el estilo"""
+    widget.setProperty(name, value)
+    widget.style().polish(widget)
+
+
+# Tramos de tiempo relativo de "último uso": (límite en segundos, texto, unidad)
+_TIME_BUCKETS = [
+    (60, "hace unos segundos", None),
+    (3600, "hace {n} min", 60),
+    (86400, "hace {n}h", 3600),
+    (2 * 86400, "ayer", None),
+    (7 * 86400, "hace {n} días", 86400),
+    (30 * 86400, "hace {n} semanas", 7 * 86400),
+    (float("inf"), "hace {n} meses", 30 * 86400),
+]
+
+
+def _parse_timestamp(value):
+    """Convierte un timestamp de SQLite (YYYY-MM-DD HH:MM:SS) o datetime a datetime"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Error parsing last_used date: {e}")
+        return None
+
+
+def _relative_time(dt: datetime) -> str:
+    """Texto relativo ("hace 5 min", "ayer"...) para una fecha pasada"""
+    seconds = (datetime.now() - dt).total_seconds()
+    for limit, text, unit in _TIME_BUCKETS:
+        if seconds < limit:
+            return text.format(n=int(seconds // unit)) if unit else text
+    return ""
+
+
+_COMMAND_TIMEOUT_MS = 30000  # Timeout de los comandos CODE
+
+
+def _decode_output(data) -> str:
+    """Decodifica la salida de un QProcess con la codificación del sistema"""
+    return bytes(data).decode(locale.getpreferredencoding(False), errors="replace")
+
+
+_MAX_CONTENT_LENGTH = 100  # Max characters for content preview
+_MAX_DESCRIPTION_LENGTH = 80  # Max characters for description
+
+# Prefijos de cada parte del texto visible
+_PFX_DESC = "📝 "
+_PFX_TAG = "🏷️ "
+_PFX_LOCK = "🔒 ********"
+_PFX_UNLOCK = "🔓 "
+_PFX_CONTENT = "📄 "
+_DISPLAY_SEPARATOR = " | "
+
+
+def _join_tags(tags) -> str:
+    """Texto de los tags de un item (lista o texto ya formateado)"""
+    if isinstance(tags, list):
+        return ", ".join(tags)
+    return str(tags) if tags else ""
+
+
+def _truncate(text: str, max_length: int) -> str:
+    """Recorta el texto a max_length caracteres añadiendo '...'"""
+    return text if len(text) <= max_length else text[:max_length] + "..."
+
+
+@functools.lru_cache(maxsize=8192)
+def _make_display_text(label: str, file_icon: str, description, tags_text,
+                       content_mode, content: str, show_labels: bool) -> str:
+    """
+    Construye el texto visible de un item (labels/descripción/tags/contenido)
+
+    Es una función pura de sus argumentos, así que el cache nunca queda
+    desactualizado; el contenido llega ya truncado para acotar la memoria.
+
+    Args:
+        description: Descripción a mostrar (None si no se muestra)
+        tags_text: Tags ya unidos con ", " (None si no se muestran)
+        content_mode: None (no mostrar), "normal", "hidden" o "revealed"
+        content: Preview del contenido ya truncado
+    """
+    display_parts = []
+
+    # 1. Show Labels (if enabled)
+    if show_labels:
+        display_parts.append(file_icon + label)
+
+    # 2. Show Description (if enabled and item has description)
+    if description:
+        display_parts.append(_PFX_DESC + _truncate(description, _MAX_DESCRIPTION_LENGTH))
+
+    # 3. Show Tags (if enabled and item has tags)
+    if tags_text:
+        display_parts.append(_PFX_TAG + tags_text)
+
+    # 4. Show Content (if enabled)
+    if content_mode == "hidden":
+        # Obfuscate sensitive content
+        display_parts.append(_PFX_LOCK)
+    elif content_mode == "revealed":
+        # Show revealed sensitive content (truncated)
+        display_parts.append(_PFX_UNLOCK + content)
+    elif content_mode == "normal" and content:
+        # Show normal content (truncated)
+        display_parts.append(_PFX_CONTENT + content)
+
+    # Join all parts with separator
+    if display_parts:
+        return _DISPLAY_SEPARATOR.join(display_parts)
+    # Fallback: show at least the label
+    return file_icon + label
+
+
+def _path_kind(path) -> str:
+    """Clasifica una ruta con un único os.stat: 'file', 'dir' o 'missing'"""
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return "missing"
+    if stat.S_ISREG(mode):
+        return "file"
+    if stat.S_ISDIR(mode):
+        return "dir"
+    return "missing"
+
+
+# Plataforma resuelta una sola vez al importar el módulo
+_SYSTEM = platform.system()
+
+
+def _windows_explorer(path: str, is_file: bool):
+    """Windows: explorer con /select para resaltar el archivo/carpeta"""
+    subprocess.run(['explorer', '/select,', path])
+
+
+def _mac_explorer(path: str, is_file: bool):
+    """macOS: mostrar en Finder"""
+    subprocess.run(['open', '-R', path])
+
+
+def _xdg_explorer(path: str, is_file: bool):
+    """Linux: abrir la carpeta contenedora (o la carpeta misma)"""
+    subprocess.run(['xdg-open', os.path.dirname(path) if is_file else path])
+
+
+_EXPLORER_CMD = {'Windows': _windows_explorer, 'Darwin': _mac_explorer}.get(_SYSTEM, _xdg_explorer)
+_EXPLORER_OPENER = {'Windows': 'explorer', 'Darwin': 'open'}.get(_SYSTEM, 'xdg-open')
+
+
+def _open_with_default_app(path: str):
+    """Abre un archivo con la aplicación predeterminada del sistema"""
+    if _SYSTEM == 'Windows':
+        os.startfile(path)
+    else:
+        subprocess.run([_EXPLORER_OPENER, path])
+
+
+def _reveal_in_explorer(path: str):
+    """Muestra la ruta en el explorador del sistema (o su carpeta padre si no existe)"""
+    path = os.path.abspath(path)
+    kind = _path_kind(path)
+
+    if kind == "missing":
+        # If path doesn't exist, try to open parent directory
+        parent = os.path.dirname(path)
+        if _path_kind(parent) == "dir":
+            subprocess.run([_EXPLORER_OPENER, parent])
+        return
+
+    _EXPLORER_CMD(path, kind == "file")
+
+
+class _ExplorerTaskSignals(QObject):
+    """Señales de _RevealInExplorerTask (QRunnable no es un QObject)"""
+    finished = pyqtSignal(bool, str)  # success, error message
+
+
+class _RevealInExplorerTask(QRunnable):
+    """Abre el explorador en un hilo del QThreadPool"""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.signals = _ExplorerTaskSignals()
+
+    def run(self):
+        try:
+            _reveal_in_explorer(self.path)
+            self.signals.finished.emit(True, "")
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+
+
+# Cambios de estado visual agrupados: dentro de batched_style_updates() los
+# ItemButton solo anotan su último estado y se aplican todos juntos al salir
+_style_batch_depth = 0
+_pending_states = {}  # ItemButton -> state
+
+
+@contextlib.contextmanager
+def batched_style_updates():
+    """
+    Agrupa los cambios de estado de varios ItemButton en una sola pasada
+
+    Ejemplo:
+        with batched_style_updates():
+            for widget in item_widgets:
+                widget.show_copied_feedback()
+    """
+    global _style_batch_depth
+    _style_batch_depth += 1
+    try:
+        yield
+    finally:
+        _style_batch_depth -= 1
+        if _style_batch_depth == 0:
+            pending = list(_pending_states.items())
+            _pending_states.clear()
+            for widget, state in pending:
+                if not sip.isdeleted(widget):
+                    widget._apply_state(state)
+
+
+# Restablecimientos diferidos de estados visuales (estado de ejecución,
+# feedback de copiado): un único QTimer compartido aplica los que ya
+# vencieron, en lugar de un QTimer.singleShot por cada uno
+_RESET_INTERVAL_MS = 50
+_pending_resets = {}  # (widget, reset) -> deadline
+_reset_timer = None
+
+
+def _schedule_reset(widget: QWidget, reset, delay_ms: int):
+    """Programa reset(widget) dentro de delay_ms (reemplaza uno igual pendiente)"""
+    global _reset_timer
+    _pending_resets[(widget, reset)] = time.monotonic() + delay_ms / 1000
+    if _reset_timer is None:
+        _reset_timer = QTimer()
+        _reset_timer.setInterval(_RESET_INTERVAL_MS)
+        _reset_timer.timeout.connect(_apply_expired_resets)
+    if not _reset_timer.isActive():
+        _reset_timer.start()
+
+
+def _apply_expired_resets():
+    """Aplica los restablecimientos cuyo plazo ya venció"""
+    now = time.monotonic()
+    with batched_style_updates():
+        for key, deadline in list(_pending_resets.items()):
+            if deadline <= now:
+                del _pending_resets[key]
+                widget, reset = key
+                if not sip.isdeleted(widget):
+                    reset(widget)
+    if not _pending_resets:
+        _reset_timer.stop()
+
+
+def _clear_exec_state(button: ActionButton):
+    """Devuelve un botón de ejecutar/renderizar a su glifo normal"""
+    button.clear_state()
+
 
 class ItemButton(QFrame):
     """Custom item button widget for content panel with tags support"""
@@ -49,53 +612,104 @@ class ItemButton(QFrame):
         self.is_revealed = False  # Track if sensitive content is revealed
         self.reveal_timer = None  # Timer for auto-hide
         self.clipboard_clear_timer = None  # Timer for clipboard clearing
+        self._actions_built = False  # Action buttons are created on first show
+        self._explorer_start_time = None  # Usage tracking for the explorer task
+        self._display_cache_key = None  # Options the cached display text was built with
+        self._display_cache_val = ""
+
+        # Item capabilities, resolved once instead of on every redraw
+        self._is_sensitive = bool(item.is_sensitive)
+        self._has_saved_file = bool(item.type is ItemType.PATH and item.file_hash)
+        self._file_icon = item.get_file_type_icon() + " " if self._has_saved_file else ""
+        self._tags_text = _join_tags(getattr(item, 'tags', None))
+        self._base_state = _BASE_STATES[(self._is_sensitive, self._has_saved_file)]
+        self._last_used_dt = _parse_timestamp(getattr(item, 'last_used', None))
+        self._command_process = None  # QProcess of a running CODE command
+        self._command_timer = None  # Timeout timer, created on first run and reused
+        self._badge = None  # Cached get_badge()/get_usage_stats() results
+        self._usage_stats = None
+        self._refresh_panel = None  # weakref to the panel refreshed by show_details
+
+        # Timers of sensitive items (auto-hide and clipboard clearing),
+        # created once and restarted on each use
+        if self._is_sensitive:
+            self.reveal_timer = QTimer(self)
+            self.reveal_timer.setSingleShot(True)
+            self.reveal_timer.timeout.connect(self.auto_hide)
+            self.clipboard_clear_timer = QTimer(self)
+            self.clipboard_clear_timer.setSingleShot(True)
+            self.clipboard_clear_timer.timeout.connect(self.clear_clipboard)
 
         # Usage tracking
-        self.usage_tracker = UsageTracker()
+        self.usage_tracker = UsageTracker.instance()
         self.execution_start_time = None
 
         # Favorites management
-        self.favorites_manager = FavoritesManager()
+        self.favorites_manager = FavoritesManager.instance()
 
         self.init_ui()
 
-    def _resolve_path(self, content_path: str) -> Path:
-        """
-        Resuelve una ruta, convirtiendo rutas relativas a absolutas si es necesario
-
-        Args:
-            content_path: Ruta desde item.content (puede ser relativa o absoluta)
-
-        Returns:
-            Path: Ruta absoluta resuelta
-        """
-        path = Path(content_path)
-
-        # Si la ruta es absoluta y existe, usarla directamente
-        if path.is_absolute():
-            return path
-
-        # Si es relativa, intentar construir ruta absoluta desde config
-        # Formato relativo: "IMAGENES/test.jpg" o "IMAGENES\test.jpg"
-        try:
-            # Intentar obtener FileManager para construir ruta absoluta
-            db_path = Path(__file__).parent.parent.parent.parent / "widget_sidebar.db"
-            config_manager = ConfigManager(str(db_path))
-            file_manager = FileManager(config_manager)
-
-            # Convertir ruta relativa a absoluta
-            absolute_path = file_manager.get_absolute_path(content_path)
-            config_manager.close()
-
-            return Path(absolute_path)
-
-        except Exception as e:
-            logger.warning(f"Could not resolve relative path '{content_path}': {e}")
-            # Fallback: asumir que es ruta absoluta
-            return path
-
     def init_ui(self):
         """Initialize button UI with new optimized design"""
+        # Only the skeleton is built here; action buttons wait for showEvent
+        self._build_skeleton()
+
+    def showEvent(self, event):
+        """Create action buttons the first time the item becomes visible"""
+        if not self._actions_built:
+            self._build_actions()
+        super().showEvent(event)
+
+    def event(self, event):
+        """Build the item tooltip only when it is requested"""
+        if event.type() == QEvent.Type.ToolTip:
+            QToolTip.showText(event.globalPos(), self._build_tooltip(), self)
+            return True
+        return super().event(event)
+
+    def _build_tooltip(self) -> str:
+        """Tooltip text: description, content preview and type"""
+        if self._is_sensitive or not self.item.content:
+            return self.item.label
+
+        # Only a bounded preview is kept, never the (possibly huge) full content
+        content = self.item.content
+        if len(content) > 100:  # Reduced to 100 chars
+            content_preview = content[:100] + "..."
+        else:
+            content_preview = content
+        # Include type and description in tooltip
+        tooltip_parts = []
+        if self.item.description:
+            tooltip_parts.append(f"{self.item.description}")
+        tooltip_parts.append(f"\n{content_preview}")
+        tooltip_parts.append(f"\nTipo: {self.item.type}")
+        return "\n".join(tooltip_parts)
+
+    def eventFilter(self, obj, event):
+        """Re-elide the label text when the label is resized"""
+        if obj is self.label_widget and event.type() == QEvent.Type.Resize:
+            self._apply_elided_text()
+        return super().eventFilter(obj, event)
+
+    def set_display_text(self, text: str):
+        """Store the full display text and show its elided version"""
+        self._full_text = text
+        self._apply_elided_text()
+
+    def _apply_elided_text(self):
+        """Elide the full text to the current label width"""
+        width = self.label_widget.contentsRect().width()
+        if width <= 0:
+            self.label_widget.setText(self._full_text)
+            return
+        elided = self.label_widget.fontMetrics().elidedText(
+            self._full_text, Qt.TextElideMode.ElideRight, width
+        )
+        self.label_widget.setText(elided)
+
+    def _build_skeleton(self):
+        """Build frame, type icon, label and badges"""
         # Set frame properties with new dimensions
         self.setFixedHeight(PanelStyles.ITEM_HEIGHT)
         self.setMinimumWidth(300)  # Keep min width for horizontal scroll
@@ -105,26 +719,10 @@ class ItemButton(QFrame):
             QSizePolicy.Policy.Fixed  # Fixed height instead of expanding
         )
 
-        # Apply new item style
-        self.setStyleSheet(PanelStyles.get_item_style())
-
-        # Set tooltip - show content preview
-        if not self.item.is_sensitive and self.item.content:
-            content_preview = self.item.content[:100]  # Reduced to 100 chars
-            if len(self.item.content) > 100:
-                content_preview += "..."
-            # Include type and description in tooltip
-            tooltip_parts = []
-            if self.item.description:
-                tooltip_parts.append(f"{self.item.description}")
-            tooltip_parts.append(f"\n{content_preview}")
-            tooltip_parts.append(f"\nTipo: {self.item.type}")
-            self.setToolTip("\n".join(tooltip_parts))
-        else:
-            self.setToolTip(self.item.label)
+        # Tooltip is built lazily on hover (see event())
 
         # Main layout - optimized spacing
-        main_layout = QHBoxLayout(self)
+        self.main_layout = main_layout = QHBoxLayout(self)
         main_layout.setContentsMargins(
             PanelStyles.ITEM_PADDING_H,
             PanelStyles.ITEM_PADDING_V,
@@ -137,373 +735,139 @@ class ItemButton(QFrame):
 
         # 1. Type Icon (14px, with 4px spacing)
         type_emoji = PanelStyles.get_icon_type_emoji(self.item.type)
-        type_color = PanelStyles.get_icon_type_color(self.item.type)
-        self.type_icon = QLabel(type_emoji)
+        self.type_icon = QLabel()
+        self.type_icon.setPixmap(_glyph_pixmap(
+            type_emoji, PanelStyles.ICON_SIZE, PanelStyles.get_icon_type_color(self.item.type)
+        ))
         self.type_icon.setFixedSize(PanelStyles.ICON_SIZE, PanelStyles.ICON_SIZE)
-        self.type_icon.setStyleSheet(f"""
-            QLabel {{
-                color: {type_color};
-                font-size: {PanelStyles.ICON_SIZE}px;
-                background: transparent;
-                border: none;
-                padding: 0px;
-            }}
-        """)
+        self.type_icon.setObjectName("itemTypeIcon")
         self.type_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.type_icon.setToolTip(f"Tipo: {self.item.type}")
         main_layout.addWidget(self.type_icon)
 
         # 2. Item Label/Tags/Content (expandable, elided if too long)
-        display_text = self.get_display_text()
-        self.label_widget = QLabel(display_text)
-        self.label_widget.setStyleSheet(PanelStyles.get_item_label_style())
-        # Enable text eliding for long labels
+        self.label_widget = QLabel()
+        self.label_widget.setObjectName("itemLabel")
+        # Text is elided manually (see _apply_elided_text), so the label must
+        # not ask the layout for the full text width
         self.label_widget.setSizePolicy(
-            QSizePolicy.Policy.Expanding,
+            QSizePolicy.Policy.Ignored,
             QSizePolicy.Policy.Fixed
         )
         self.label_widget.setWordWrap(False)  # No wrap, use eliding
         self.label_widget.setTextFormat(Qt.TextFormat.PlainText)
+        self.label_widget.installEventFilter(self)
+        self.set_display_text(self.get_display_text())
         main_layout.addWidget(self.label_widget, 1)  # Stretch factor 1
 
-        # 3. Badges (compact, inline) - Use new PanelStyles
+        # 3. Badges (compact, inline) - all in a single rich-text label
+        badges = []  # (html, tooltip)
+
         # Favorite badge
-        if hasattr(self.item, 'is_favorite') and self.item.is_favorite:
-            fav_badge = QLabel("⭐")
-            fav_badge.setStyleSheet(PanelStyles.get_badge_style('favorite'))
-            fav_badge.setToolTip("Favorito")
-            main_layout.addWidget(fav_badge)
+        if self.item.is_favorite:
+            badges.append((PanelStyles.get_badge_html("⭐", 'favorite'), "Favorito"))
+
+        # use_count/category_name are attached only by some callers (search results)
+        use_count = getattr(self.item, 'use_count', None)
 
         # Popular badge (if use_count > 50)
-        if hasattr(self.item, 'use_count') and self.item.use_count and self.item.use_count > 50:
-            pop_badge = QLabel("🔥")
-            pop_badge.setStyleSheet(PanelStyles.get_badge_style('popular'))
-            pop_badge.setToolTip(f"Popular ({self.item.use_count} usos)")
-            main_layout.addWidget(pop_badge)
+        if use_count and use_count > 50:
+            badges.append((PanelStyles.get_badge_html("🔥", 'popular'), f"Popular ({use_count} usos)"))
 
         # New badge (if use_count == 0)
-        if hasattr(self.item, 'use_count') and self.item.use_count == 0:
-            new_badge = QLabel("🆕")
-            new_badge.setStyleSheet(PanelStyles.get_badge_style('new'))
-            new_badge.setToolTip("Nuevo")
-            main_layout.addWidget(new_badge)
+        if use_count == 0:
+            badges.append((PanelStyles.get_badge_html("🆕", 'new'), "Nuevo"))
 
         # Category badge (for global search)
-        if self.show_category and hasattr(self.item, 'category_name') and self.item.category_name:
-            category_badge = QLabel(f"📁 {self.item.category_name}")
-            category_badge.setStyleSheet(PanelStyles.get_badge_style('default'))
-            category_badge.setToolTip(f"Categoría: {self.item.category_name}")
-            main_layout.addWidget(category_badge)
+        category_name = getattr(self.item, 'category_name', None) if self.show_category else None
+        if category_name:
+            badges.append((PanelStyles.get_badge_html(f"📁 {category_name}"), f"Categoría: {category_name}"))
 
         # File badge (for PATH items with saved files)
-        if (self.item.type == ItemType.PATH and
-            hasattr(self.item, 'file_hash') and self.item.file_hash):
-            file_badge = QLabel("📦")
-            file_badge.setStyleSheet(PanelStyles.get_badge_style('default'))
-            file_badge.setToolTip("Archivo guardado en almacenamiento organizado")
-            main_layout.addWidget(file_badge)
+        if self._has_saved_file:
+            badges.append((PanelStyles.get_badge_html("📦"), "Archivo guardado en almacenamiento organizado"))
 
         # Table badge (for table items)
-        if hasattr(self.item, 'table_id') and self.item.table_id:
-            table_badge = QLabel("📊")
-            table_badge.setStyleSheet(PanelStyles.get_badge_style('default'))
-            table_badge.setToolTip(f"Item de tabla (ID: {self.item.table_id})")
-            main_layout.addWidget(table_badge)
+        if self.item.table_id:
+            badges.append((PanelStyles.get_badge_html("📊"), f"Item de tabla (ID: {self.item.table_id})"))
+
+        if badges:
+            self.badges_label = QLabel("&nbsp;".join(badge for badge, _ in badges))
+            self.badges_label.setTextFormat(Qt.TextFormat.RichText)
+            self.badges_label.setToolTip("\n".join(tip for _, tip in badges))
+            main_layout.addWidget(self.badges_label)
 
         # Spacer to push action buttons to the right
         main_layout.addStretch()
 
+        # Shared stylesheet for every item; the visual state (sensitive,
+        # saved file, copied...) is selected through the "state" property
+        self.setProperty("state", self._base_state)
+        self.setStyleSheet(_ITEM_STYLESHEET)
+
+    def _build_actions(self):
+        """Build action buttons (execute/render/url/path/table/reveal/info)"""
+        self._actions_built = True
+        main_layout = self.main_layout
+
         # ==== ACTION BUTTONS (compact 28x28px) ====
-        if self.item.type == ItemType.CODE:
+        if self.item.type is ItemType.CODE:
             # Execute command button (only for CODE items)
-            self.execute_button = QPushButton("⚡")
-            self.execute_button.setFixedSize(28, 28)
-            self.execute_button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {PanelStyles.ACCENT_WARNING};
-                    color: #000000;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12pt;
-                    padding: 0px;
-                }}
-                QPushButton:hover {{
-                    background-color: {PanelStyles.ACCENT_HOVER};
-                    color: #ffffff;
-                }}
-                QPushButton:pressed {{
-                    background-color: {PanelStyles.ACCENT_SUBTLE};
-                }}
-            """)
-            self.execute_button.setCursor(Qt.CursorShape.PointingHandCursor)
-            self.execute_button.setToolTip("Ejecutar comando")
+            self.execute_button = ActionButton("⚡", "execute", "Ejecutar comando")
             self.execute_button.clicked.connect(self.execute_command)
             main_layout.addWidget(self.execute_button)
 
-        elif self.item.type == 'WEB_STATIC' or self.item.type == ItemType.WEB_STATIC:
+        elif self.item.type is ItemType.WEB_STATIC:
             # Render button (only for WEB_STATIC items) - FIRST FOR VISIBILITY
-            self.render_button = QPushButton("📱")  # Cambiado de 🌐 a 📱 para diferenciarlo de URL
-            self.render_button.setFixedSize(28, 28)
-            self.render_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12pt;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-                QPushButton:pressed {
-                    background-color: #388E3C;
-                }
-            """)
-            self.render_button.setCursor(Qt.CursorShape.PointingHandCursor)
-            self.render_button.setToolTip("Renderizar aplicación web estática")
+            # Cambiado de 🌐 a 📱 para diferenciarlo de URL
+            self.render_button = ActionButton("📱", "render", "Renderizar aplicación web estática")
             self.render_button.clicked.connect(self.render_web_static)
             main_layout.addWidget(self.render_button)
 
-        elif self.item.type == ItemType.URL:
-            # URL action buttons - two buttons layout
-            url_buttons_layout = QHBoxLayout()
-            url_buttons_layout.setSpacing(4)
-
-            # Open in embedded browser button
-            self.open_url_button = QPushButton("🌐")
-            self.open_url_button.setFixedSize(28, 28)
-            self.open_url_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #007acc;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12pt;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #005a9e;
-                }
-                QPushButton:pressed {
-                    background-color: #004578;
-                }
-            """)
-            self.open_url_button.setCursor(Qt.CursorShape.PointingHandCursor)
-            self.open_url_button.setToolTip("Abrir en navegador embebido")
+        elif self.item.type is ItemType.URL:
+            # URL action buttons - open in embedded browser
+            self.open_url_button = ActionButton("🌐", "open_url", "Abrir en navegador embebido")
             self.open_url_button.clicked.connect(self.open_in_browser)
-            url_buttons_layout.addWidget(self.open_url_button)
+            main_layout.addWidget(self.open_url_button)
 
             # Open in system browser button (NEW)
-            self.open_external_button = QPushButton("🔗")
-            self.open_external_button.setFixedSize(28, 28)
-            self.open_external_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #0078d4;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12pt;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #106ebe;
-                }
-                QPushButton:pressed {
-                    background-color: #005a9e;
-                }
-            """)
-            self.open_external_button.setCursor(Qt.CursorShape.PointingHandCursor)
-            self.open_external_button.setToolTip("Abrir en navegador predeterminado del sistema")
+            self.open_external_button = ActionButton("🔗", "open_external", "Abrir en navegador predeterminado del sistema")
             self.open_external_button.clicked.connect(self.open_in_system_browser)
-            url_buttons_layout.addWidget(self.open_external_button)
-
-            main_layout.addLayout(url_buttons_layout)
-
-        elif self.item.type == ItemType.PATH:
-            # PATH action buttons
-            path_buttons_layout = QHBoxLayout()
-            path_buttons_layout.setSpacing(4)
-
-            # Open in explorer button
-            self.open_explorer_button = QPushButton("📁")
-            self.open_explorer_button.setFixedSize(28, 28)
-            self.open_explorer_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2d7d2d;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12pt;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #236123;
-                }
-                QPushButton:pressed {
-                    background-color: #1a4a1a;
-                }
-            """)
-            self.open_explorer_button.setCursor(Qt.CursorShape.PointingHandCursor)
-            self.open_explorer_button.setToolTip("Abrir en explorador")
+            main_layout.addWidget(self.open_external_button)
+
+        elif self.item.type is ItemType.PATH:
+            # PATH action buttons - open in explorer
+            self.open_explorer_button = ActionButton("📁", "open_explorer", "Abrir en explorador")
             self.open_explorer_button.clicked.connect(self.open_in_explorer)
-            path_buttons_layout.addWidget(self.open_explorer_button)
+            main_layout.addWidget(self.open_explorer_button)
 
             # Open file button (only if it's a file, not a directory)
             # Resolver ruta (relativa -> absoluta si es necesario)
-            path = self._resolve_path(self.item.content)
-            if path.exists() and path.is_file():
-                self.open_file_button = QPushButton("📝")
-                self.open_file_button.setFixedSize(28, 28)
-                self.open_file_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #cc7a00;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 12pt;
-                        padding: 0px;
-                    }
-                    QPushButton:hover {
-                        background-color: #9e5e00;
-                    }
-                    QPushButton:pressed {
-                        background-color: #784500;
-                    }
-                """)
-                self.open_file_button.setCursor(Qt.CursorShape.PointingHandCursor)
-                self.open_file_button.setToolTip("Abrir archivo")
+            path = _resolve_path(self.item.content)
+            if _path_kind(path) == "file":
+                self.open_file_button = ActionButton("📝", "open_file", "Abrir archivo")
                 self.open_file_button.clicked.connect(self.open_file)
-                path_buttons_layout.addWidget(self.open_file_button)
-
-            main_layout.addLayout(path_buttons_layout)
+                main_layout.addWidget(self.open_file_button)
 
         # Common buttons (for all item types)
 
         # View table button (for table items)
-        if hasattr(self.item, 'table_id') and self.item.table_id:
-            self.view_table_btn = QPushButton("🗂️")
-            self.view_table_btn.setFixedSize(28, 28)
-            self.view_table_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            self.view_table_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #007acc;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12pt;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #005a9e;
-                }
-                QPushButton:pressed {
-                    background-color: #004578;
-                }
-            """)
-            self.view_table_btn.setToolTip(f"Ver tabla completa")
+        if self.item.table_id:
+            self.view_table_btn = ActionButton("🗂️", "view_table", "Ver tabla completa")
             self.view_table_btn.clicked.connect(self.view_table)
             main_layout.addWidget(self.view_table_btn)
 
         # Reveal button for sensitive items
-        if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive:
-            self.reveal_button = QPushButton("👁")
-            self.reveal_button.setFixedSize(28, 28)
-            self.reveal_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #cc0000;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12pt;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #9e0000;
-                }
-                QPushButton:pressed {
-                    background-color: #780000;
-                }
-            """)
-            self.reveal_button.setCursor(Qt.CursorShape.PointingHandCursor)
-            self.reveal_button.setToolTip("Revelar/Ocultar contenido sensible")
+        if self._is_sensitive:
+            self.reveal_button = ActionButton("👁", "reveal", "Revelar/Ocultar contenido sensible")
             self.reveal_button.clicked.connect(self.toggle_reveal)
             main_layout.addWidget(self.reveal_button)
 
         # Info button (show details) - ALWAYS LAST
-        self.info_btn = QPushButton("ℹ️")
-        self.info_btn.setFixedSize(28, 28)
-        self.info_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.info_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                font-size: 12pt;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: #3e3e42;
-                border-radius: 3px;
-            }
-        """)
-        self.info_btn.setToolTip("Ver detalles del item")
+        self.info_btn = ActionButton("ℹ️", "info", "Ver detalles del item")
         self.info_btn.clicked.connect(self.show_details)
         main_layout.addWidget(self.info_btn)
 
-        # Set initial style (different for sensitive items and file items)
-        if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #3d2020;
-                    border: none;
-                    border-left: 3px solid #cc0000;
-                    border-bottom: 1px solid #1e1e1e;
-                }
-                QFrame:hover {
-                    background-color: #4d2525;
-                }
-                QLabel {
-                    color: #cccccc;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
-        elif (self.item.type == ItemType.PATH and
-              hasattr(self.item, 'file_hash') and self.item.file_hash):
-            # Special style for PATH items with saved files
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2d2d2d;
-                    border: none;
-                    border-left: 3px solid #4CAF50;
-                    border-bottom: 1px solid #1e1e1e;
-                }
-                QFrame:hover {
-                    background-color: #3d3d3d;
-                }
-                QLabel {
-                    color: #cccccc;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2d2d2d;
-                    border: none;
-                    border-bottom: 1px solid #1e1e1e;
-                }
-                QFrame:hover {
-                    background-color: #3d3d3d;
-                }
-                QLabel {
-                    color: #cccccc;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
-
     def mousePressEvent(self, event):
         """Handle mouse press event"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -513,7 +877,7 @@ class ItemButton(QFrame):
     def on_clicked(self):
         """Handle button click"""
         # Track clipboard copy (comando simple)
-        if self.item.type not in [ItemType.URL, ItemType.PATH]:
+        if self.item.type not in (ItemType.URL, ItemType.PATH):
             start_time = self.usage_tracker.track_execution_start(self.item.id)
 
         # Emit signal with item
@@ -523,16 +887,16 @@ class ItemButton(QFrame):
         self.show_copied_feedback()
 
         # Track completion for clipboard copy
-        if self.item.type not in [ItemType.URL, ItemType.PATH]:
+        if self.item.type not in (ItemType.URL, ItemType.PATH):
             self.usage_tracker.track_execution_end(self.item.id, start_time, True, None)
 
         # If sensitive item, start clipboard auto-clear timer
-        if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive:
+        if self._is_sensitive:
             self.start_clipboard_clear_timer()
 
     def open_in_browser(self):
         """Open URL in embedded browser"""
-        if self.item.type == ItemType.URL:
+        if self.item.type is ItemType.URL:
             # Track execution start
             start_time = self.usage_tracker.track_execution_start(self.item.id)
             success = False
@@ -553,18 +917,7 @@ class ItemButton(QFrame):
                 logger.info(f"URL open requested in embedded browser: {url}")
 
                 # Update button style briefly to show it was clicked
-                original_style = self.open_url_button.styleSheet()
-                self.open_url_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 12pt;
-                        padding: 0px;
-                    }
-                """)
-                QTimer.singleShot(300, lambda: self.open_url_button.setStyleSheet(original_style))
+                self.open_url_button.flash()
 
             except Exception as e:
                 logger.error(f"Error opening URL {self.item.label}: {e}")
@@ -576,7 +929,7 @@ class ItemButton(QFrame):
 
     def open_in_system_browser(self):
         """Open URL in system default browser (Chrome, Firefox, Edge, etc.)"""
-        if self.item.type == ItemType.URL:
+        if self.item.type is ItemType.URL:
             # Track execution start
             start_time = self.usage_tracker.track_execution_start(self.item.id)
             success = False
@@ -597,18 +950,7 @@ class ItemButton(QFrame):
                 logger.info(f"URL opened in system browser: {url}")
 
                 # Update button style briefly to show it was clicked
-                original_style = self.open_external_button.styleSheet()
-                self.open_external_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 12pt;
-                        padding: 0px;
-                    }
-                """)
-                QTimer.singleShot(300, lambda: self.open_external_button.setStyleSheet(original_style))
+                self.open_external_button.flash()
 
             except Exception as e:
                 logger.error(f"Error opening URL in system browser {self.item.label}: {e}")
@@ -619,107 +961,46 @@ class ItemButton(QFrame):
                 self.usage_tracker.track_execution_end(self.item.id, start_time, success, error_msg)
 
     def open_in_explorer(self):
-        """Open file/folder in system file explorer"""
-        if self.item.type == ItemType.PATH:
+        """Open file/folder in system file explorer (off the UI thread)"""
+        if self.item.type is ItemType.PATH:
             # Track execution start
-            start_time = self.usage_tracker.track_execution_start(self.item.id)
-            success = False
-            error_msg = None
+            self._explorer_start_time = self.usage_tracker.track_execution_start(self.item.id)
 
-            try:
-                # Resolver ruta (relativa -> absoluta si es necesario)
-                path = self._resolve_path(self.item.content)
-                system = platform.system()
-
-                if system == 'Windows':
-                    # Windows: Use explorer with /select to highlight the file/folder
-                    if path.exists():
-                        subprocess.run(['explorer', '/select,', str(path.absolute())])
-                    else:
-                        # If path doesn't exist, try to open parent directory
-                        parent = path.parent
-                        if parent.exists():
-                            subprocess.run(['explorer', str(parent.absolute())])
-
-                elif system == 'Darwin':  # macOS
-                    if path.exists():
-                        subprocess.run(['open', '-R', str(path.absolute())])
-                    else:
-                        parent = path.parent
-                        if parent.exists():
-                            subprocess.run(['open', str(parent.absolute())])
-
-                else:  # Linux
-                    if path.exists():
-                        if path.is_file():
-                            subprocess.run(['xdg-open', str(path.parent.absolute())])
-                        else:
-                            subprocess.run(['xdg-open', str(path.absolute())])
-                    else:
-                        parent = path.parent
-                        if parent.exists():
-                            subprocess.run(['xdg-open', str(parent.absolute())])
-
-                success = True
+            # Resolver ruta (relativa -> absoluta si es necesario)
+            path = _resolve_path(self.item.content)
 
-                # Visual feedback
-                original_style = self.open_explorer_button.styleSheet()
-                self.open_explorer_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 12pt;
-                        padding: 0px;
-                    }
-                """)
-                QTimer.singleShot(300, lambda: self.open_explorer_button.setStyleSheet(original_style))
+            # stat + subprocess pueden bloquear en discos lentos o de red
+            task = _RevealInExplorerTask(os.fspath(path))
+            task.signals.finished.connect(self._on_explorer_finished)
+            QThreadPool.globalInstance().start(task)
 
-            except Exception as e:
-                logger.error(f"Error opening explorer for {self.item.label}: {e}")
-                error_msg = str(e)
+    def _on_explorer_finished(self, success: bool, error_msg: str):
+        """Visual feedback and usage tracking once the explorer was launched"""
+        if success:
+            self.open_explorer_button.flash()
+        else:
+            logger.error(f"Error opening explorer for {self.item.label}: {error_msg}")
 
-            finally:
-                # Track execution end
-                self.usage_tracker.track_execution_end(self.item.id, start_time, success, error_msg)
+        # Track execution end
+        self.usage_tracker.track_execution_end(
+            self.item.id, self._explorer_start_time, success, error_msg or None
+        )
 
     def open_file(self):
         """Open file with default application"""
-        if self.item.type == ItemType.PATH:
+        if self.item.type is ItemType.PATH:
             # Resolver ruta (relativa -> absoluta si es necesario)
-            path = self._resolve_path(self.item.content)
+            path = _resolve_path(self.item.content)
 
-            if not path.exists() or not path.is_file():
+            if _path_kind(path) != "file":
                 logger.warning(f"File not found: {path}")
                 return
 
             try:
-                system = platform.system()
-
-                if system == 'Windows':
-                    # Windows: Use os.startfile
-                    os.startfile(str(path.absolute()))
-
-                elif system == 'Darwin':  # macOS
-                    subprocess.run(['open', str(path.absolute())])
-
-                else:  # Linux
-                    subprocess.run(['xdg-open', str(path.absolute())])
+                _open_with_default_app(os.path.abspath(path))
 
                 # Visual feedback
-                original_style = self.open_file_button.styleSheet()
-                self.open_file_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 12pt;
-                        padding: 0px;
-                    }
-                """)
-                QTimer.singleShot(300, lambda: self.open_file_button.setStyleSheet(original_style))
+                self.open_file_button.flash()
 
             except Exception as e:
                 print(f"Error opening file: {e}")
@@ -728,174 +1009,85 @@ class ItemButton(QFrame):
         """Show visual feedback that item was copied"""
         self.is_copied = True
 
-        # Different style for sensitive items (orange/warning color)
-        if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #cc7a00;
-                    border: none;
-                    border-bottom: 1px solid #9e5e00;
-                }
-                QLabel {
-                    color: #ffffff;
-                    background-color: transparent;
-                    border: none;
-                    font-weight: bold;
-                }
-            """)
-        else:
-            # Normal items: blue feedback
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #007acc;
-                    border: none;
-                    border-bottom: 1px solid #005a9e;
-                }
-                QLabel {
-                    color: #ffffff;
-                    background-color: transparent;
-                    border: none;
-                    font-weight: bold;
-                }
-            """)
+        # Different style for sensitive items (orange/warning color),
+        # normal items get blue feedback
+        self._set_state(_COPIED_STATES[self._is_sensitive])
 
         # Reset after 500ms
-        QTimer.singleShot(500, self.reset_style)
+        _schedule_reset(self, ItemButton.reset_style, 500)
+
+    def _set_state(self, state: str):
+        """Cambia el estado visual del frame (diferido si hay un batch activo)"""
+        if _style_batch_depth:
+            _pending_states[self] = state
+        else:
+            self._apply_state(state)
+
+    def _apply_state(self, state: str):
+        """Aplica el estado visual al frame y a sus labels"""
+        _set_state_property(self, "state", state)
+        # Los selectores descendientes solo se re-evalúan al pulir cada label
+        for label in self.findChildren(QLabel):
+            label.style().polish(label)
 
     def reset_style(self):
         """Reset button style to normal"""
         self.is_copied = False
-        # Apply special style for sensitive items
-        if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #3d2020;
-                    border: none;
-                    border-left: 3px solid #cc0000;
-                    border-bottom: 1px solid #1e1e1e;
-                }
-                QFrame:hover {
-                    background-color: #4d2525;
-                }
-                QLabel {
-                    color: #cccccc;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
-        elif (self.item.type == ItemType.PATH and
-              hasattr(self.item, 'file_hash') and self.item.file_hash):
-            # Special style for PATH items with saved files
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2d2d2d;
-                    border: none;
-                    border-left: 3px solid #4CAF50;
-                    border-bottom: 1px solid #1e1e1e;
-                }
-                QFrame:hover {
-                    background-color: #3d3d3d;
-                }
-                QLabel {
-                    color: #cccccc;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2d2d2d;
-                    border: none;
-                    border-bottom: 1px solid #1e1e1e;
-                }
-                QFrame:hover {
-                    background-color: #3d3d3d;
-                }
-                QLabel {
-                    color: #cccccc;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
+        self._set_state(self._base_state)
 
     def get_display_text(self):
         """Get display text based on selected display options (labels/tags/content/description)"""
-        MAX_CONTENT_LENGTH = 100  # Max characters for content preview
-        MAX_DESCRIPTION_LENGTH = 80  # Max characters for description
-
-        display_parts = []
-
-        # Get file type icon if this is a PATH item with file metadata
-        file_icon = ""
-        if (self.item.type == ItemType.PATH and
-            hasattr(self.item, 'file_hash') and self.item.file_hash and
-            hasattr(self.item, 'get_file_type_icon')):
-            file_icon = self.item.get_file_type_icon() + " "
-
-        # 1. Show Labels (if enabled)
-        if self.show_labels:
-            display_parts.append(f"{file_icon}{self.item.label}")
-
-        # 2. Show Description (if enabled and item has description)
-        if self.show_description and hasattr(self.item, 'description') and self.item.description:
-            description = self.item.description[:MAX_DESCRIPTION_LENGTH]
-            if len(self.item.description) > MAX_DESCRIPTION_LENGTH:
-                description += "..."
-            display_parts.append(f"📝 {description}")
-
-        # 3. Show Tags (if enabled and item has tags)
-        if self.show_tags and hasattr(self.item, 'tags') and self.item.tags:
-            if isinstance(self.item.tags, list):
-                tags_text = ", ".join(self.item.tags)
-            else:
-                tags_text = str(self.item.tags)
-            display_parts.append(f"🏷️ {tags_text}")
+        # Item changes are not tracked here: callers use invalidate_display_text()
+        key = (self.show_labels, self.show_description, self.show_tags,
+               self.show_content, self.is_revealed)
+        if key == self._display_cache_key:
+            return self._display_cache_val
+
+        tags_text = self._tags_text if self.show_tags else None
 
-        # 4. Show Content (if enabled)
+        # Content preview: bounded before it reaches the cache key
+        content_mode = None
+        content = ""
         if self.show_content:
-            # Handle sensitive content
-            if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive and not self.is_revealed:
-                # Obfuscate sensitive content
-                display_parts.append("🔒 ********")
-            elif hasattr(self.item, 'is_sensitive') and self.item.is_sensitive and self.is_revealed:
-                # Show revealed sensitive content (truncated)
-                content = self.item.content[:MAX_CONTENT_LENGTH]
-                if len(self.item.content) > MAX_CONTENT_LENGTH:
-                    content += "..."
-                display_parts.append(f"🔓 {content}")
+            if self._is_sensitive:
+                content_mode = "revealed" if self.is_revealed else "hidden"
             else:
-                # Show normal content (truncated)
-                if self.item.content:
-                    content = self.item.content[:MAX_CONTENT_LENGTH]
-                    if len(self.item.content) > MAX_CONTENT_LENGTH:
-                        content += "..."
-                    display_parts.append(f"📄 {content}")
-
-        # Join all parts with separator
-        if display_parts:
-            return " | ".join(display_parts)
-        else:
-            # Fallback: show at least the label
-            return f"{file_icon}{self.item.label}"
+                content_mode = "normal"
+            if content_mode != "hidden":
+                content = _truncate(self.item.content or "", _MAX_CONTENT_LENGTH)
+
+        self._display_cache_val = _make_display_text(
+            self.item.label,
+            self._file_icon,
+            self.item.description if self.show_description else None,
+            tags_text,
+            content_mode,
+            content,
+            self.show_labels,
+        )
+        self._display_cache_key = key
+        return self._display_cache_val
+
+    def invalidate_display_text(self):
+        """Descarta el texto cacheado (llamar si el item se modificó en sitio)"""
+        self._display_cache_key = None
+
+    def invalidate_tags_cache(self):
+        """Vuelve a unir los tags del item (llamar tras modificarlos en sitio)"""
+        self._tags_text = _join_tags(getattr(self.item, 'tags', None))
+        self._display_cache_key = None
 
     def get_display_label(self):
         """Get display label (ofuscado si es sensible y no revelado) - DEPRECATED, use get_display_text()"""
-        # Get file type icon if this is a PATH item with file metadata
-        file_icon = ""
-        if (self.item.type == ItemType.PATH and
-            hasattr(self.item, 'file_hash') and self.item.file_hash and
-            hasattr(self.item, 'get_file_type_icon')):
-            file_icon = self.item.get_file_type_icon() + " "
-
-        if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive and not self.is_revealed:
+        file_icon = self._file_icon
+
+        if self._is_sensitive and not self.is_revealed:
             # Ofuscar: mostrar label + (********)
             content_preview = "********"
             return f"{file_icon}{self.item.label} ({content_preview})"
-        elif hasattr(self.item, 'is_sensitive') and self.item.is_sensitive and self.is_revealed:
+        elif self._is_sensitive and self.is_revealed:
             # Revelado: mostrar label + preview del contenido
-            content = self.item.content[:30] if len(self.item.content) > 30 else self.item.content
-            return f"{file_icon}{self.item.label} ({content}...)" if len(self.item.content) > 30 else f"{file_icon}{self.item.label} ({content})"
+            return f"{file_icon}{self.item.label} ({_truncate(self.item.content, 30)})"
         else:
             # Item normal: solo el label (con icono de archivo si aplica)
             return f"{file_icon}{self.item.label}"
@@ -905,25 +1097,19 @@ class ItemButton(QFrame):
         self.is_revealed = not self.is_revealed
 
         # Update label with new display text
-        self.label_widget.setText(self.get_display_text())
+        self.set_display_text(self.get_display_text())
 
         if self.is_revealed:
             # Cambiar icono del boton
-            self.reveal_button.setText("🙈")
+            self.reveal_button.set_glyph("🙈")
             self.reveal_button.setToolTip("Ocultar contenido sensible")
 
-            # Cancelar timer anterior si existe
+            # Auto-ocultar despues de 10 segundos (reinicia el timer si ya corría)
             if self.reveal_timer:
-                self.reveal_timer.stop()
-
-            # Auto-ocultar despues de 10 segundos
-            self.reveal_timer = QTimer()
-            self.reveal_timer.setSingleShot(True)
-            self.reveal_timer.timeout.connect(self.auto_hide)
-            self.reveal_timer.start(10000)  # 10 segundos
+                self.reveal_timer.start(10000)  # 10 segundos
         else:
             # Cambiar icono del boton
-            self.reveal_button.setText("👁")
+            self.reveal_button.set_glyph("👁")
             self.reveal_button.setToolTip("Revelar/Ocultar contenido sensible")
 
             # Cancelar timer si existe
@@ -937,20 +1123,13 @@ class ItemButton(QFrame):
 
     def start_clipboard_clear_timer(self):
         """Start timer to clear clipboard after 30 seconds for sensitive items"""
-        # Cancel previous timer if exists
+        # Start (or restart) the 30-second timer
         if self.clipboard_clear_timer:
-            self.clipboard_clear_timer.stop()
-
-        # Start 30-second timer
-        self.clipboard_clear_timer = QTimer()
-        self.clipboard_clear_timer.setSingleShot(True)
-        self.clipboard_clear_timer.timeout.connect(self.clear_clipboard)
-        self.clipboard_clear_timer.start(30000)  # 30 seconds
+            self.clipboard_clear_timer.start(30000)  # 30 seconds
 
     def clear_clipboard(self):
         """Clear clipboard content"""
         try:
-            import pyperclip
             pyperclip.copy("")  # Clear clipboard
         except Exception as e:
             print(f"Error clearing clipboard: {e}")
@@ -986,19 +1165,20 @@ class ItemButton(QFrame):
 
     def get_badge(self) -> str:
         """Obtener badge del item (🔥 Popular)"""
-        use_count = getattr(self.item, 'use_count', 0)
-
-        # Popular: más de 50 usos
-        if use_count > 50:
-            return "🔥"
-
-        # Badge "Nuevo" deshabilitado
-        return ""
+        if self._badge is None:
+            # Popular: más de 50 usos (badge "Nuevo" deshabilitado)
+            self._badge = "🔥" if getattr(self.item, 'use_count', 0) > 50 else ""
+        return self._badge
 
     def get_usage_stats(self) -> str:
         """Obtener estadísticas de uso (use_count + last_used)"""
+        if self._usage_stats is None:
+            self._usage_stats = self._compute_usage_stats()
+        return self._usage_stats
+
+    def _compute_usage_stats(self) -> str:
+        """Construye el texto de estadísticas de uso"""
         use_count = getattr(self.item, 'use_count', 0)
-        last_used = getattr(self.item, 'last_used', None)
 
         parts = []
 
@@ -1009,58 +1189,37 @@ class ItemButton(QFrame):
             parts.append("Sin usar")
 
         # Last used
-        if last_used:
-            from datetime import datetime
-            try:
-                # Parse SQLite datetime format: YYYY-MM-DD HH:MM:SS
-                # Si ya es datetime, usarlo directamente
-                if isinstance(last_used, datetime):
-                    last_used_dt = last_used
-                else:
-                    last_used_dt = datetime.strptime(str(last_used), "%Y-%m-%d %H:%M:%S")
-
-                now = datetime.now()
-                diff = now - last_used_dt
-
-                # Format relative time
-                if diff.days == 0:
-                    if diff.seconds < 60:
-                        time_str = "hace unos segundos"
-                    elif diff.seconds < 3600:
-                        minutes = diff.seconds // 60
-                        time_str = f"hace {minutes} min"
-                    else:
-                        hours = diff.seconds // 3600
-                        time_str = f"hace {hours}h"
-                elif diff.days == 1:
-                    time_str = "ayer"
-                elif diff.days < 7:
-                    time_str = f"hace {diff.days} días"
-                elif diff.days < 30:
-                    weeks = diff.days // 7
-                    time_str = f"hace {weeks} semanas"
-                else:
-                    months = diff.days // 30
-                    time_str = f"hace {months} meses"
-
-                parts.append(f"último: {time_str}")
-            except Exception as e:
-                logger.debug(f"Error parsing last_used date: {e}")
+        if self._last_used_dt:
+            parts.append(f"último: {_relative_time(self._last_used_dt)}")
 
         return " | ".join(parts) if parts else ""
 
+    def invalidate_usage_cache(self):
+        """Descarta badge y estadísticas cacheados (tras cambiar use_count/last_used)"""
+        self._last_used_dt = _parse_timestamp(getattr(self.item, 'last_used', None))
+        self._badge = None
+        self._usage_stats = None
+
+    def _get_refresh_panel(self):
+        """Panel contenedor a refrescar desde el dialog de detalles (cacheado)"""
+        refresh_panel = self._refresh_panel() if self._refresh_panel else None
+        if refresh_panel is not None and not sip.isdeleted(refresh_panel):
+            return refresh_panel
+
+        # Find the FloatingPanel or GlobalSearchPanel parent to pass to dialog
+        parent_widget = self.parent()
+        while parent_widget:
+            class_name = parent_widget.__class__.__name__
+            if class_name in ('FloatingPanel', 'GlobalSearchPanel', 'FavoritesFloatingPanel'):
+                self._refresh_panel = weakref.ref(parent_widget)
+                return parent_widget
+            parent_widget = parent_widget.parent()
+        return None
+
     def show_details(self):
         """Mostrar ventana de detalles del item"""
         try:
-            # Find the FloatingPanel or GlobalSearchPanel parent to pass to dialog
-            refresh_panel = None
-            parent_widget = self.parent()
-            while parent_widget:
-                class_name = parent_widget.__class__.__name__
-                if class_name in ('FloatingPanel', 'GlobalSearchPanel', 'FavoritesFloatingPanel'):
-                    refresh_panel = parent_widget
-                    break
-                parent_widget = parent_widget.parent()
+            refresh_panel = self._get_refresh_panel()
 
             dialog = ItemDetailsDialog(self.item, floating_panel=refresh_panel, parent=self.window())
             dialog.exec()
@@ -1069,7 +1228,7 @@ class ItemButton(QFrame):
 
     def view_table(self):
         """Emite señal para ver la tabla completa"""
-        if not hasattr(self.item, 'table_id') or not self.item.table_id:
+        if not self.item.table_id:
             return
 
         # Get table name from database
@@ -1088,181 +1247,124 @@ class ItemButton(QFrame):
         logger.info(f"Table view requested: {table_name}")
 
     def execute_command(self):
-        """Ejecutar comando de tipo CODE"""
-        if self.item.type != ItemType.CODE:
+        """Ejecutar comando de tipo CODE (en un QProcess, sin bloquear la UI)"""
+        if self.item.type is not ItemType.CODE:
+            return
+        if self._command_process is not None:
+            # Ya hay una ejecución en curso para este item
             return
 
         # Track execution start
-        start_time = self.usage_tracker.track_execution_start(self.item.id)
-        success = False
-        error_msg = None
-
-        try:
-            command = self.item.content.strip()
-
-            # Visual feedback - cambiar botón a amarillo mientras ejecuta
-            original_style = self.execute_button.styleSheet()
-            self.execute_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #ffff00;
-                    color: #000000;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12pt;
-                    padding: 0px;
-                }
-            """)
-            self.execute_button.setText("⏳")
-
-            # Ejecutar comando usando subprocess
-            # En Windows, necesitamos usar shell=True para comandos como 'dir', 'git', etc.
-            system = platform.system()
-
-            # Determinar directorio de trabajo
-            cwd = None
-            if hasattr(self.item, 'working_dir') and self.item.working_dir:
-                from pathlib import Path
-                working_dir_path = Path(self.item.working_dir)
-                if working_dir_path.exists() and working_dir_path.is_dir():
-                    cwd = str(working_dir_path.absolute())
-                    logger.info(f"Executing command in working directory: {cwd}")
-                else:
-                    logger.warning(f"Working directory does not exist: {self.item.working_dir}")
-
-            if system == 'Windows':
-                # En Windows, usar cmd.exe para ejecutar el comando
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,  # Timeout de 30 segundos
-                    cwd=cwd  # Directorio de trabajo
-                )
+        self._command_start_time = self.usage_tracker.track_execution_start(self.item.id)
+        self._command_text = self.item.content.strip()
+        self._command_timed_out = False
+
+        # Visual feedback - cambiar botón a amarillo mientras ejecuta
+        self.execute_button.set_state("running", "⏳")
+
+        # Determinar directorio de trabajo
+        cwd = None
+        if self.item.working_dir:
+            working_dir_path = Path(self.item.working_dir)
+            if working_dir_path.exists() and working_dir_path.is_dir():
+                cwd = str(working_dir_path.absolute())
+                logger.info(f"Executing command in working directory: {cwd}")
             else:
-                # En Unix-like systems, usar bash
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    executable='/bin/bash',
-                    cwd=cwd  # Directorio de trabajo
-                )
-
-            # Obtener output y error
-            stdout = result.stdout if result.stdout else ""
-            stderr = result.stderr if result.stderr else ""
-            return_code = result.returncode
-
-            # Considerar éxito si return code es 0
-            success = (return_code == 0)
-
-            # Restaurar botón
-            self.execute_button.setText("⚡")
-            if success:
-                # Verde si éxito
-                self.execute_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #000000;
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 12pt;
-                        padding: 0px;
-                    }
-                """)
-            else:
-                # Rojo si error
-                self.execute_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #ff0000;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 3px;
-                        font-size: 12pt;
-                        padding: 0px;
-                    }
-                """)
-                error_msg = stderr if stderr else "Error desconocido"
-
-            # Restaurar estilo original después de 1 segundo
-            QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
-
-            # Mostrar dialog con el resultado
-            dialog = CommandOutputDialog(
-                command=command,
-                output=stdout,
-                error=stderr,
-                return_code=return_code,
-                parent=self.window()
-            )
-            dialog.exec()
-
-        except subprocess.TimeoutExpired:
+                logger.warning(f"Working directory does not exist: {self.item.working_dir}")
+
+        process = QProcess(self)
+        if _SYSTEM == 'Windows':
+            # En Windows, usar cmd.exe para ejecutar el comando ('dir', 'git', etc.)
+            # (línea nativa: setArguments escaparía las comillas como \", que cmd.exe no entiende)
+            process.setProgram('cmd.exe')
+            process.setNativeArguments('/c ' + self._command_text)
+        else:
+            # En Unix-like systems, usar bash
+            process.setProgram('/bin/bash')
+            process.setArguments(['-c', self._command_text])
+        if cwd:
+            process.setWorkingDirectory(cwd)
+        process.finished.connect(self._on_command_finished)
+        process.errorOccurred.connect(self._on_command_error)
+        self._command_process = process
+
+        # Timeout de 30 segundos
+        if self._command_timer is None:
+            self._command_timer = QTimer(self)
+            self._command_timer.setSingleShot(True)
+            self._command_timer.timeout.connect(self._on_command_timeout)
+        self._command_timer.start(_COMMAND_TIMEOUT_MS)
+
+        process.start()
+
+    def _on_command_timeout(self):
+        """Mata el proceso si sigue corriendo al vencer el timeout"""
+        process = self._command_process
+        if process is not None and process.state() != QProcess.ProcessState.NotRunning:
             logger.error(f"Command timeout: {self.item.label}")
-            error_msg = "Comando excedió el tiempo de espera (30 segundos)"
-
-            # Restaurar botón con estilo de error
-            self.execute_button.setText("⚡")
-            self.execute_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #ff0000;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12pt;
-                    padding: 0px;
-                }
-            """)
-            QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
-
-            # Mostrar dialog de error
-            dialog = CommandOutputDialog(
-                command=command,
-                output="",
-                error=error_msg,
-                return_code=-1,
-                parent=self.window()
-            )
-            dialog.exec()
+            self._command_timed_out = True
+            process.kill()
+
+    def _on_command_error(self, error):
+        """El comando no pudo iniciarse (finished no se emite en ese caso)"""
+        if error == QProcess.ProcessError.FailedToStart:
+            error_msg = self._command_process.errorString()
+            logger.error(f"Error executing command {self.item.label}: {error_msg}")
+            self._finish_command("", error_msg, -1, error_msg)
+
+    def _on_command_finished(self, exit_code, exit_status):
+        """Recoge la salida del proceso y muestra el resultado"""
+        process = self._command_process
+        if process is None:
+            return
 
-        except Exception as e:
-            logger.error(f"Error executing command {self.item.label}: {e}")
-            error_msg = str(e)
+        if self._command_timed_out:
+            error_msg = f"Comando excedió el tiempo de espera ({_COMMAND_TIMEOUT_MS // 1000} segundos)"
+            self._finish_command("", error_msg, -1, error_msg)
+            return
 
-            # Restaurar botón con estilo de error
-            self.execute_button.setText("⚡")
-            self.execute_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #ff0000;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12pt;
-                    padding: 0px;
-                }
-            """)
-            QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
-
-            # Mostrar dialog de error
-            dialog = CommandOutputDialog(
-                command=command if 'command' in locals() else self.item.content,
-                output="",
-                error=error_msg,
-                return_code=-1,
-                parent=self.window()
-            )
-            dialog.exec()
+        # Obtener output y error
+        stdout = _decode_output(process.readAllStandardOutput())
+        stderr = _decode_output(process.readAllStandardError())
+        return_code = exit_code if exit_status == QProcess.ExitStatus.NormalExit else -1
 
-        finally:
-            # Track execution end
-            self.usage_tracker.track_execution_end(self.item.id, start_time, success, error_msg)
+        # Considerar éxito si return code es 0
+        error_msg = None
+        if return_code != 0:
+            error_msg = stderr if stderr else "Error desconocido"
+        self._finish_command(stdout, stderr, return_code, error_msg)
+
+    def _finish_command(self, stdout: str, stderr: str, return_code: int, error_msg):
+        """Restaura el botón, registra el uso y muestra el dialog con el resultado"""
+        self._command_timer.stop()
+        self._command_process.deleteLater()
+        self._command_process = None
+        success = return_code == 0
+
+        # Restaurar botón: verde si éxito, rojo si error
+        self.execute_button.set_state("ok" if success else "error")
+
+        # Restaurar estilo original después de 1 segundo
+        _schedule_reset(self.execute_button, _clear_exec_state, 1000)
+
+        # Track execution end
+        self.usage_tracker.track_execution_end(
+            self.item.id, self._command_start_time, success, error_msg
+        )
+
+        # Mostrar dialog con el resultado
+        dialog = CommandOutputDialog(
+            command=self._command_text,
+            output=stdout,
+            error=stderr,
+            return_code=return_code,
+            parent=self.window()
+        )
+        dialog.exec()
 
     def render_web_static(self):
         """Renderiza item WEB_STATIC en navegador embebido seguro"""
-        if self.item.type != 'WEB_STATIC' and self.item.type != ItemType.WEB_STATIC:
+        if self.item.type is not ItemType.WEB_STATIC:
             return
 
         # Track execution start
@@ -1272,17 +1374,7 @@ class ItemButton(QFrame):
 
         try:
             # Visual feedback - cambiar botón mientras abre
-            original_style = self.render_button.styleSheet()
-            self.render_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #00d4ff;
-                    color: #000000;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12pt;
-                    padding: 0px;
-                }
-            """)
+            self.render_button.set_state("render_active")
 
             # Emitir señal con el item completo
             self.web_static_render_requested.emit(self.item)
@@ -1291,24 +1383,15 @@ class ItemButton(QFrame):
             logger.info(f"WEB_STATIC render requested for item: {self.item.label}")
 
             # Restaurar estilo después de 300ms
-            QTimer.singleShot(300, lambda: self.render_button.setStyleSheet(original_style))
+            _schedule_reset(self.render_button, _clear_exec_state, 300)
 
         except Exception as e:
             logger.error(f"Error rendering WEB_STATIC item {self.item.label}: {e}")
             error_msg = str(e)
 
             # Restaurar estilo con color de error
-            self.render_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #f44336;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 3px;
-                    font-size: 12pt;
-                    padding: 0px;
-                }
-            """)
-            QTimer.singleShot(1000, lambda: self.render_button.setStyleSheet(original_style))
+            self.render_button.set_state("render_error")
+            _schedule_reset(self.render_button, _clear_exec_state, 1000)
 
         finally:
             # Track execution end
@@ -10,15 +10,151 @@ en un grid responsive. Incluye:
 - Bordes de color según tipo
 """
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QFrame, QPushButton, QGraphicsDropShadowEffect,
-                             QGraphicsOpacityEffect, QMessageBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QSize, QTimer, QRect
-from PyQt6.QtGui import QCursor, QColor, QPainter, QPen, QFont
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                             QFrame, QPushButton, QGraphicsBlurEffect,
+                             QGraphicsScene, QGraphicsPixmapItem,
+                             QMessageBox, qDrawBorderPixmap)
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QRect, QRectF, QMargins, QLine
+from PyQt6.QtGui import (QCursor, QColor, QPainter, QPen, QBrush, QFont, QImage, QPixmap,
+                         QFontMetrics, QTextLayout)
+from PyQt6 import sip
+from html import escape
+from typing import List, NamedTuple, Tuple
+import functools
 import logging
+import weakref
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TYPE_COLOR = '#555555'
+
+
+@functools.lru_cache(maxsize=2048)
+def _date_text(date) -> str:
+    """Solo la fecha (YYYY-MM-DD) de un timestamp"""
+    return str(date)[:10]
+
+
+class CardRecord(NamedTuple):
+    """Campos ya preparados que muestra una card"""
+    item_type: str
+    icon: str
+    name: str               # Nombre a mostrar (se elide al ancho de la card)
+    description: str        # Descripción completa (preview, diálogo y copia)
+    date_str: str
+    badge_text: str
+    content_type: str
+    original_name: str      # Nombre completo que se copia al portapapeles
+    tags: tuple
+
+
+def prepare_card_records(items: List[Tuple[dict, str]]) -> List[CardRecord]:
+    """
+    Prepara en una sola pasada los campos de texto de las cards
+
+    Args:
+        items: Pares (item_data, item_type) de los elementos del proyecto
+
+    Returns:
+        Lista de CardRecord, en el mismo orden
+    """
+    type_icons = ProjectCardWidget.TYPE_ICONS
+    component_types = ProjectCardWidget.COMPONENT_TYPES
+    records = []
+    for item_data, item_type in items:
+        get = item_data.get
+
+        if item_type in component_types:
+            badge_text = f"{type_icons.get(item_type, '💬')} {item_type.upper()}"
+        else:
+            badge_text = item_type.upper()
+
+        date = get('updated_at', get('created_at', ''))
+
+        records.append(CardRecord(
+            item_type=item_type,
+            icon=get('icon', type_icons.get(item_type, '📄')),
+            name=get('name', get('content', 'Sin nombre')),
+            description=get('description', '') or get('content', ''),
+            date_str=_date_text(date) if date else '',
+            badge_text=badge_text,
+            content_type=get('type') or '',
+            original_name=get('name', get('content', '')),
+            tags=tuple(get('tags') or ()),
+        ))
+    return records
+
+
+def _card_stylesheet(type_colors: dict) -> str:
+    """
+    Stylesheet único de las cards: el color por tipo, el badge de componentes
+    y el feedback de copiado se eligen con propiedades dinámicas
+    (cardType, component, copied) en lugar de un setStyleSheet por estado.
+    El fondo y el borde de la card los dibuja paintEvent
+    """
+    rules = [f"""
+        QPushButton#cardName {{
+            color: #ffffff;
+            font-size: 10pt;
+            font-weight: bold;
+            background-color: #1e1e1e;
+            border: 2px solid {DEFAULT_TYPE_COLOR};
+            border-radius: 8px;
+            padding: 8px 12px;
+            text-align: left;
+        }}
+        QPushButton#cardName:hover {{
+            background-color: {DEFAULT_TYPE_COLOR}30;
+            border: 2px solid #ffffff;
+        }}
+        QPushButton#cardName:pressed {{
+            background-color: {DEFAULT_TYPE_COLOR}50;
+            border: 3px solid {DEFAULT_TYPE_COLOR};
+        }}
+        QLabel#cardBadge {{
+            background-color: {DEFAULT_TYPE_COLOR};
+            color: #000000;
+            font-size: 7pt;
+            font-weight: bold;
+            border-radius: 5px;
+            padding: 2px 6px;
+        }}
+        QLabel#cardBadge[component="true"] {{
+            font-size: 8pt;
+        }}
+        QFrame#cardSeparator {{
+            background-color: {DEFAULT_TYPE_COLOR};
+            max-height: 1px;
+        }}
+        QLabel#cardFooter {{
+            color: #888888;
+            font-size: 8pt;
+        }}
+    """]
+    for item_type, color in type_colors.items():
+        selector = f'[cardType="{item_type}"]'
+        rules.append(f"""
+        QPushButton#cardName{selector} {{ border-color: {color}; }}
+        QPushButton#cardName{selector}:hover {{ background-color: {color}30; }}
+        QPushButton#cardName{selector}:pressed {{
+            background-color: {color}50;
+            border: 3px solid {color};
+        }}
+        QLabel#cardBadge{selector} {{ background-color: {color}; }}
+        QFrame#cardSeparator{selector} {{ background-color: {color}; }}
+        """)
+    rules.append("""
+        QPushButton#cardName[copied="true"],
+        QPushButton#cardName[copied="true"]:hover,
+        QPushButton#cardName[copied="true"]:pressed {
+            color: #000000;
+            background-color: #00ff88;
+            border: 3px solid #00ff88;
+            padding: 6px 12px;
+        }
+    """)
+    return "".join(rules)
+
 
 class ProjectCardWidget(QWidget):
     """Card moderna para mostrar elementos del proyecto en modo limpio"""
@@ -40,6 +176,11 @@ class ProjectCardWidget(QWidget):
         'divider': '#555555'   # Gris
     }
 
+    # Tipos que son componentes (fondo azul oscuro y badge destacado)
+    COMPONENT_TYPES = ('comment', 'alert', 'note', 'divider')
+
+    STYLESHEET = _card_stylesheet(TYPE_COLORS)
+
     # Iconos por tipo
     TYPE_ICONS = {
         'tag': '🏷️',
@@ -54,74 +195,103 @@ class ProjectCardWidget(QWidget):
         'divider': '─'
     }
 
-    def __init__(self, item_data: dict, item_type: str, parent=None):
+    # Sombras pre-renderizadas: estado -> (blur, offset Y, color RGBA)
+    SHADOWS = {
+        'normal': (10, 2, (0, 0, 0, 60)),
+        'hover': (20, 6, (0, 0, 0, 100)),
+        'copied': (25, 8, (0, 255, 136, 150)),
+    }
+    CARD_RADIUS = 8
+    CONTENT_MARGIN = 26  # Margen interior del contenido (incluye el borde)
+
+    # Borde y fondo del frame (dibujados en paintEvent, no por QSS)
+    _TYPE_QCOLOR = {t: QColor(c) for t, c in TYPE_COLORS.items()}
+    _BORDER_PENS = {t: QPen(c, 2) for t, c in _TYPE_QCOLOR.items()}
+    _DEFAULT_BORDER_PEN = QPen(QColor(DEFAULT_TYPE_COLOR), 2)
+    _HOVER_BORDER_PEN = QPen(QColor('#ffffff'), 2)
+    _COPIED_BORDER_PEN = QPen(QColor(0, 255, 136), 3)
+    # (estado, es_componente) -> color de fondo
+    _FRAME_COLORS = {
+        ('normal', False): QColor('#2d2d2d'),
+        ('normal', True): QColor('#1a2332'),
+        ('hover', False): QColor('#353535'),
+        ('hover', True): QColor('#223244'),
+        ('copied', False): QColor('#1a3d2e'),
+        ('copied', True): QColor('#1a3d2e'),
+    }
+
+    # Cache compartido de pixmaps de sombra (9-slice): (blur, color) -> (QPixmap, margen)
+    _shadow_cache = {}
+    # Fondo completo (sombra ya compuesta) por (estado, ancho, alto, dpr)
+    _background_cache = {}
+
+    # Colores/plumas del indicador de copiado, creados una sola vez
+    _COPIED_COLOR = QColor(0, 255, 136)
+    _CHECK_BRUSH = QBrush(_COPIED_COLOR)
+    _CIRCLE_PEN = QPen(QColor(0, 200, 100), 2)
+    _CHECK_PEN = QPen(QColor(0, 0, 0), 3, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+    _copied_font = None  # Se crea al primer uso (requiere la fuente de la app)
+
+    # Timer compartido que oculta el indicador de copiado; solo una card lo
+    # muestra a la vez (weakref para no mantener viva una card destruida)
+    _copied_timer = None
+    _active_copied_card = None
+
+    # Geometría del checkmark relativa a su centro (coordenadas enteras)
+    _CHECK_BG_RECT = QRect(-20, -20, 40, 40)
+    _CHECK_LINES = (QLine(-8, 0, -3, 6), QLine(-3, 6, 8, -6))
+
+    # QFontMetrics compartidos por fuente (font.key() -> QFontMetrics)
+    _metrics_cache = {}
+    # Caracteres de la descripción que se consideran para el preview de 2 líneas
+    PREVIEW_SCAN_CHARS = 300
+
+    def __init__(self, record: CardRecord, parent=None):
         """
         Args:
-            item_data: Datos del elemento (puede ser relation o component)
-            item_type: Tipo de elemento ('tag', 'item', 'category', etc.)
+            record: Campos de la card preparados con prepare_card_records()
         """
         super().__init__(parent)
 
-        self.item_data = item_data
-        self.item_type = item_type
+        self.record = record
+        self.item_type = item_type = record.item_type
         self.is_hovered = False
         self.show_copied_indicator = False  # Para mostrar checkmark al copiar
 
         # Guardar el nombre original completo para copiar
-        self.original_name = item_data.get('name', item_data.get('content', ''))
+        self.original_name = record.original_name
 
         # Configurar tamaño fijo de la card (aumentado de 160 a 180)
         self.setFixedSize(280, 180)
         # NO configurar cursor aquí - el botón tendrá su propio cursor
 
-        self.init_ui()
-        self.setup_shadow_effect()
-
-        # Timer para ocultar el indicador de copiado
-        self.copied_timer = QTimer()
-        self.copied_timer.setSingleShot(True)
-        self.copied_timer.timeout.connect(self.hide_copied_indicator)
+        self.shadow_state = 'normal'  # Sombra pre-renderizada a dibujar
 
-    def init_ui(self):
-        """Inicializa la interfaz de la card"""
-        # Layout principal
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-
-        # Frame contenedor
-        self.card_frame = QFrame()
-        self.card_frame.setObjectName("cardFrame")
+        # Borde/fondo actuales del frame; cambian junto con la sombra
+        self._is_component = item_type in self.COMPONENT_TYPES
+        self._type_border_pen = self._BORDER_PENS.get(item_type, self._DEFAULT_BORDER_PEN)
+        self._border_pen = self._type_border_pen
+        self._frame_color = self._FRAME_COLORS[('normal', self._is_component)]
 
-        # Color del borde según tipo
-        border_color = self.TYPE_COLORS.get(self.item_type, '#555555')
+        # El contenido se construye al mostrarse la card por primera vez
+        self._inited = False
 
-        # Detectar si es componente para usar color de fondo diferente
-        is_component = self.item_type in ['comment', 'alert', 'note', 'divider']
+    def showEvent(self, event):
+        """Construye el contenido de la card la primera vez que se muestra"""
+        if not self._inited:
+            self._inited = True
+            self.init_ui()
+        super().showEvent(event)
 
-        # Colores de fondo específicos para componentes
-        if is_component:
-            bg_color = '#1a2332'  # Azul oscuro para componentes
-            hover_color = '#223244'
-        else:
-            bg_color = '#2d2d2d'  # Gris oscuro para relaciones
-            hover_color = '#353535'
-
-        self.card_frame.setStyleSheet(f"""
-            QFrame#cardFrame {{
-                background-color: {bg_color};
-                border: 2px solid {border_color};
-                border-radius: 8px;
-                padding: 12px;
-            }}
-            QFrame#cardFrame:hover {{
-                background-color: {hover_color};
-                border-color: #ffffff;
-            }}
-        """)
+    def init_ui(self):
+        """Inicializa la interfaz de la card"""
+        # Detectar si es componente para usar un badge diferente
+        is_component = self._is_component
 
-        card_layout = QVBoxLayout(self.card_frame)
-        card_layout.setContentsMargins(12, 12, 12, 12)
+        # Layout directamente sobre la card (borde y fondo en paintEvent)
+        card_layout = QVBoxLayout(self)
+        card_layout.setContentsMargins(self.CONTENT_MARGIN, self.CONTENT_MARGIN,
+                                       self.CONTENT_MARGIN, self.CONTENT_MARGIN)
         card_layout.setSpacing(8)
 
         # Header: Icono + Nombre + Badge
@@ -129,20 +299,18 @@ class ProjectCardWidget(QWidget):
         header_layout.setSpacing(8)
 
         # Icono del elemento
-        icon = self.item_data.get('icon', self.TYPE_ICONS.get(self.item_type, '📄'))
-        icon_label = QLabel(icon)
+        record = self.record
+        icon_label = QLabel(record.icon)
         icon_label.setStyleSheet("font-size: 20pt;")
         icon_label.setFixedSize(32, 32)
         header_layout.addWidget(icon_label)
 
         # Nombre del elemento como botón clickeable
-        name = self.item_data.get('name', self.item_data.get('content', 'Sin nombre'))
-        # Truncar nombre largo para mostrar
-        display_name = name
-        if len(name) > 25:
-            display_name = name[:22] + '...'
+        name = record.name
 
-        self.name_button = QPushButton(display_name)
+        # El texto (elidido al ancho real) se asigna al final, con el estilo ya aplicado
+        self.name_button = QPushButton()
+        self.name_button.setObjectName("cardName")
         self.name_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.name_button.setToolTip(f"Click para copiar: {name}")
         self.name_button.clicked.connect(self._on_name_button_clicked)
@@ -150,68 +318,22 @@ class ProjectCardWidget(QWidget):
         # Ajustar altura mínima para evitar texto cortado
         self.name_button.setMinimumHeight(32)
         self.name_button.setMaximumHeight(40)
-
-        # Color del borde según tipo
-        border_color = self.TYPE_COLORS.get(self.item_type, '#555555')
-
-        self.name_button.setStyleSheet(f"""
-            QPushButton {{
-                color: #ffffff;
-                font-size: 10pt;
-                font-weight: bold;
-                background-color: #1e1e1e;
-                border: 2px solid {border_color};
-                border-radius: 8px;
-                padding: 8px 12px;
-                text-align: left;
-            }}
-            QPushButton:hover {{
-                background-color: {border_color}30;
-                border: 2px solid #ffffff;
-            }}
-            QPushButton:pressed {{
-                background-color: {border_color}50;
-                border: 3px solid {border_color};
-            }}
-        """)
         header_layout.addWidget(self.name_button, 1)
 
         # Badge de tipo - Más grande y distintivo para componentes
-        is_component = self.item_type in ['comment', 'alert', 'note', 'divider']
-
         if is_component:
             # Badge especial para componentes - Más destacado
-            component_icons = {
-                'comment': '💬',
-                'alert': '⚠️',
-                'note': '📌',
-                'divider': '─'
-            }
-            icon = component_icons.get(self.item_type, '💬')
-            badge_text = f"{icon} {self.item_type.upper()}"
             badge_width = 95
             badge_height = 26
-            badge_font_size = "8pt"
         else:
             # Badge normal para relaciones
-            badge_text = self.item_type.upper()
             badge_width = 48
             badge_height = 20
-            badge_font_size = "7pt"
 
-        type_badge = QLabel(badge_text)
+        type_badge = QLabel(record.badge_text)
         type_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
         type_badge.setFixedSize(badge_width, badge_height)
-        type_badge.setStyleSheet(f"""
-            QLabel {{
-                background-color: {border_color};
-                color: #000000;
-                font-size: {badge_font_size};
-                font-weight: bold;
-                border-radius: 5px;
-                padding: 2px 6px;
-            }}
-        """)
+        type_badge.setObjectName("cardBadge")
         header_layout.addWidget(type_badge)
 
         card_layout.addLayout(header_layout)
@@ -219,24 +341,16 @@ class ProjectCardWidget(QWidget):
         # Separador
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet(f"background-color: {border_color}; max-height: 1px;")
+        separator.setObjectName("cardSeparator")
         card_layout.addWidget(separator)
 
         # Descripción / Preview - Ahora como botón clickeable
-        description = self.item_data.get('description', '')
-        content = self.item_data.get('content', '')
-
         # Guardar texto completo para mostrar en diálogo
-        self.full_description = description if description else content
-
-        # Texto truncado para preview
-        preview_text = self.full_description
-        if preview_text and len(preview_text) > 100:
-            preview_text = preview_text[:97] + '...'
+        self.full_description = record.description
 
         # Usar QPushButton en lugar de QLabel para hacerlo clickeable
-        self.preview_button = QPushButton(preview_text or "Sin descripción")
-        # QPushButton NO tiene setWordWrap - el texto se ajustará con el estilo CSS
+        # (texto elidido a 2 líneas al final de init_ui)
+        self.preview_button = QPushButton()
         self.preview_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.preview_button.clicked.connect(self._show_full_description)
 
@@ -244,12 +358,6 @@ class ProjectCardWidget(QWidget):
         if self.full_description and len(self.full_description) > 100:
             self.preview_button.setToolTip("🔍 Click para ver descripción completa")
 
-        # Configurar para que el texto se ajuste con word-wrap en CSS
-        self.preview_button.setSizePolicy(
-            self.preview_button.sizePolicy().horizontalPolicy(),
-            self.preview_button.sizePolicy().verticalPolicy()
-        )
-
         self.preview_button.setStyleSheet("""
             QPushButton {
                 color: #aaaaaa;
@@ -260,7 +368,6 @@ class ProjectCardWidget(QWidget):
                 border-radius: 4px;
                 padding: 6px;
                 text-align: left;
-                qproperty-wordWrap: true;
             }
             QPushButton:hover {
                 background-color: #333333;
@@ -275,44 +382,75 @@ class ProjectCardWidget(QWidget):
         card_layout.addWidget(self.preview_button, 1)
 
         # Tags (si existen)
-        if 'tags' in self.item_data and self.item_data['tags']:
+        if record.tags:
             self._add_tags_section(card_layout)
 
-        # Footer: Metadata
-        footer_layout = QHBoxLayout()
-        footer_layout.setSpacing(8)
-
-        # Tipo de contenido (para items)
-        if 'type' in self.item_data and self.item_data['type']:
-            content_type_label = QLabel(f"📋 {self.item_data['type']}")
-            content_type_label.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-size: 8pt;
-                }
-            """)
-            footer_layout.addWidget(content_type_label)
-
-        footer_layout.addStretch()
-
-        # Fecha de última modificación (si existe)
-        if 'updated_at' in self.item_data or 'created_at' in self.item_data:
-            date = self.item_data.get('updated_at', self.item_data.get('created_at', ''))
-            if date:
-                # Extraer solo la fecha (primeros 10 caracteres)
-                date_str = str(date)[:10]
-                date_label = QLabel(f"⏰ {date_str}")
-                date_label.setStyleSheet("""
-                    QLabel {
-                        color: #888888;
-                        font-size: 8pt;
-                    }
-                """)
-                footer_layout.addWidget(date_label)
+        # Footer: tipo de contenido (izquierda) y fecha (derecha) en un solo label
+        if record.content_type or record.date_str:
+            content_type = f"📋 {escape(record.content_type)}" if record.content_type else ""
+            date = f"⏰ {record.date_str}" if record.date_str else ""
+            footer_label = QLabel(
+                f'<table width="100%" cellspacing="0" cellpadding="0"><tr>'
+                f'<td>{content_type}</td><td align="right">{date}</td>'
+                f'</tr></table>'
+            )
+            footer_label.setTextFormat(Qt.TextFormat.RichText)
+            footer_label.setObjectName("cardFooter")
+            card_layout.addWidget(footer_label)
+
+        # Estilo compartido por todas las cards, seleccionado por propiedades
+        for widget in (self.name_button, type_badge, separator):
+            widget.setProperty("cardType", self.item_type)
+            widget.setProperty("component", is_component)
+        self.setStyleSheet(self.STYLESHEET)
+
+        self._elide_texts(name, badge_width)
+
+    @classmethod
+    def _font_metrics(cls, font: QFont) -> QFontMetrics:
+        """QFontMetrics cacheado por fuente"""
+        key = font.key()
+        metrics = cls._metrics_cache.get(key)
+        if metrics is None:
+            metrics = QFontMetrics(font)
+            cls._metrics_cache[key] = metrics
+        return metrics
+
+    def _elide_texts(self, name: str, badge_width: int):
+        """Elide el nombre a 1 línea y el preview a 2 según el ancho disponible (una sola vez)"""
+        # Ancho útil: card - márgenes del layout
+        content_width = self.width() - 2 * self.CONTENT_MARGIN
+
+        # Nombre: menos icono, espaciados, badge y padding/borde del botón
+        self.name_button.ensurePolished()
+        name_width = content_width - 32 - 2 * 8 - badge_width - 28
+        metrics = self._font_metrics(self.name_button.font())
+        self.name_button.setText(metrics.elidedText(name, Qt.TextElideMode.ElideRight, name_width))
 
-        card_layout.addLayout(footer_layout)
+        if not self.full_description:
+            self.preview_button.setText("Sin descripción")
+            return
 
-        main_layout.addWidget(self.card_frame)
+        # Preview en 2 líneas: la primera cortada por palabras, la segunda elidida
+        self.preview_button.ensurePolished()
+        preview_width = content_width - 14
+        font = self.preview_button.font()
+        text = " ".join(self.full_description[:self.PREVIEW_SCAN_CHARS].split())
+
+        layout = QTextLayout(text, font)
+        layout.beginLayout()
+        line = layout.createLine()
+        line.setLineWidth(preview_width)
+        first_line = text[:line.textLength()].rstrip()
+        layout.endLayout()
+
+        rest = text[line.textLength():]
+        if rest:
+            metrics = self._font_metrics(font)
+            second_line = metrics.elidedText(rest, Qt.TextElideMode.ElideRight, preview_width)
+            self.preview_button.setText(f"{first_line}\n{second_line}")
+        else:
+            self.preview_button.setText(first_line)
 
     def _add_tags_section(self, layout):
         """Agrega la sección de tags al layout"""
@@ -321,7 +459,7 @@ class ProjectCardWidget(QWidget):
         tags_layout.setContentsMargins(0, 4, 0, 0)
 
         # Obtener los tags
-        tags = self.item_data.get('tags', [])
+        tags = self.record.tags
 
         # Mostrar máximo 3 tags
         max_visible_tags = 3
@@ -367,23 +505,88 @@ class ProjectCardWidget(QWidget):
         """)
         return chip
 
-    def setup_shadow_effect(self):
-        """Configura el efecto de sombra"""
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(10)
-        self.shadow.setXOffset(0)
-        self.shadow.setYOffset(2)
-        self.shadow.setColor(QColor(0, 0, 0, 60))
-        self.card_frame.setGraphicsEffect(self.shadow)
+    @classmethod
+    def _shadow_pixmap(cls, blur: int, rgba: tuple):
+        """
+        Renderiza (una sola vez) la sombra difuminada de una card como pixmap 9-slice
+
+        Returns:
+            (QPixmap, margen): el margen es el tamaño de las esquinas del 9-slice
+        """
+        key = (blur, rgba)
+        cached = cls._shadow_cache.get(key)
+        if cached is None:
+            margin = blur + cls.CARD_RADIUS
+            size = 2 * margin + 2
+
+            # Rectángulo redondeado sólido con espacio alrededor para el blur
+            image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+            image.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(image)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(*rgba))
+            painter.drawRoundedRect(QRectF(blur, blur, size - 2 * blur, size - 2 * blur),
+                                    cls.CARD_RADIUS, cls.CARD_RADIUS)
+            painter.end()
+
+            # Difuminarlo una vez con QGraphicsBlurEffect
+            scene = QGraphicsScene()
+            item = QGraphicsPixmapItem(QPixmap.fromImage(image))
+            blur_effect = QGraphicsBlurEffect()
+            blur_effect.setBlurRadius(blur)
+            item.setGraphicsEffect(blur_effect)
+            scene.addItem(item)
+
+            result = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+            result.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(result)
+            scene.render(painter, QRectF(0, 0, size, size), QRectF(0, 0, size, size))
+            painter.end()
+
+            cached = (QPixmap.fromImage(result), margin)
+            cls._shadow_cache[key] = cached
+        return cached
+
+    @classmethod
+    def _background_pixmap(cls, state: str, width: int, height: int, dpr: float) -> QPixmap:
+        """Fondo estático de la card (sombra compuesta a su tamaño), cacheado"""
+        key = (state, width, height, dpr)
+        pixmap = cls._background_cache.get(key)
+        if pixmap is None:
+            blur, y_offset, rgba = cls.SHADOWS[state]
+            shadow, margin = cls._shadow_pixmap(blur, rgba)
+
+            pixmap = QPixmap(round(width * dpr), round(height * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            target = QRect(0, 0, width, height).adjusted(-blur, -blur + y_offset, blur, blur + y_offset)
+            qDrawBorderPixmap(painter, target, QMargins(margin, margin, margin, margin), shadow)
+            painter.end()
+            cls._background_cache[key] = pixmap
+        return pixmap
+
+    def set_shadow_state(self, state: str):
+        """Cambia la sombra y el borde dibujados ('normal', 'hover' o 'copied')"""
+        if state != self.shadow_state:
+            self.shadow_state = state
+            if state == 'copied':
+                self._border_pen = self._COPIED_BORDER_PEN
+            elif state == 'hover':
+                self._border_pen = self._HOVER_BORDER_PEN
+            else:
+                self._border_pen = self._type_border_pen
+            self._frame_color = self._FRAME_COLORS[(state, self._is_component)]
+            self.update()
 
     def enterEvent(self, event):
         """Al pasar el mouse sobre la card"""
         self.is_hovered = True
 
-        # Animar sombra - aumentar blur y offset
-        self.shadow.setBlurRadius(20)
-        self.shadow.setYOffset(6)
-        self.shadow.setColor(QColor(0, 0, 0, 100))
+        # Sombra elevada
+        if not self.show_copied_indicator:
+            self.set_shadow_state('hover')
 
         super().enterEvent(event)
 
@@ -392,9 +595,8 @@ class ProjectCardWidget(QWidget):
         self.is_hovered = False
 
         # Restaurar sombra
-        self.shadow.setBlurRadius(10)
-        self.shadow.setYOffset(2)
-        self.shadow.setColor(QColor(0, 0, 0, 60))
+        if not self.show_copied_indicator:
+            self.set_shadow_state('normal')
 
         super().leaveEvent(event)
 
@@ -455,7 +657,6 @@ class ProjectCardWidget(QWidget):
 
         # Si se hizo click en copiar
         if dialog.clickedButton() == copy_button:
-            from PyQt6.QtWidgets import QApplication
             QApplication.clipboard().setText(self.full_description)
             logger.info(f"Description copied to clipboard")
 
@@ -467,132 +668,104 @@ class ProjectCardWidget(QWidget):
 
     def show_copy_feedback(self):
         """Muestra feedback visual de que se copió al portapapeles"""
-        # Activar indicador
+        # Activar indicador (el cambio de sombra de abajo fuerza el repaint)
         self.show_copied_indicator = True
-        self.update()  # Forzar repaint
-
-        # Cambiar estilo del BOTÓN temporalmente
-        self.name_button.setStyleSheet(f"""
-            QPushButton {{
-                color: #000000;
-                font-size: 10pt;
-                font-weight: bold;
-                background-color: #00ff88;
-                border: 3px solid #00ff88;
-                border-radius: 8px;
-                padding: 6px 12px;
-                text-align: left;
-            }}
-        """)
 
-        # Cambiar color del borde de la card
-        border_color = self.TYPE_COLORS.get(self.item_type, '#555555')
-        self.card_frame.setStyleSheet(f"""
-            QFrame#cardFrame {{
-                background-color: #1a3d2e;
-                border: 3px solid #00ff88;
-                border-radius: 8px;
-                padding: 12px;
-            }}
-        """)
+        # Estilo de copiado del botón y del borde de la card
+        self._set_copied_style(True)
 
-        # Iniciar animación de sombra
-        self.shadow.setBlurRadius(25)
-        self.shadow.setYOffset(8)
-        self.shadow.setColor(QColor(0, 255, 136, 150))
+        # Sombra verde de copiado
+        self.set_shadow_state('copied')
 
         # Ocultar indicador después de 1 segundo
-        self.copied_timer.start(1000)
+        self._start_copied_timer()
+
+    def _start_copied_timer(self):
+        """Oculta el indicador de la card anterior y programa el de esta"""
+        cls = ProjectCardWidget
+        previous = cls._active_copied_card() if cls._active_copied_card else None
+        if previous is not None and previous is not self and not sip.isdeleted(previous):
+            previous.hide_copied_indicator()
+        cls._active_copied_card = weakref.ref(self)
+
+        if cls._copied_timer is None:
+            cls._copied_timer = QTimer()
+            cls._copied_timer.setSingleShot(True)
+            cls._copied_timer.timeout.connect(cls._on_copied_timeout)
+        cls._copied_timer.start(1000)
+
+    @classmethod
+    def _on_copied_timeout(cls):
+        """Oculta el indicador de la card activa (si sigue existiendo)"""
+        card = cls._active_copied_card() if cls._active_copied_card else None
+        cls._active_copied_card = None
+        if card is not None and not sip.isdeleted(card):
+            card.hide_copied_indicator()
 
     def hide_copied_indicator(self):
         """Oculta el indicador de copiado"""
         self.show_copied_indicator = False
-        self.update()
 
         # Restaurar estilo original
-        border_color = self.TYPE_COLORS.get(self.item_type, '#555555')
-
-        # Restaurar estilo del BOTÓN
-        self.name_button.setStyleSheet(f"""
-            QPushButton {{
-                color: #ffffff;
-                font-size: 10pt;
-                font-weight: bold;
-                background-color: #1e1e1e;
-                border: 2px solid {border_color};
-                border-radius: 8px;
-                padding: 8px 12px;
-                text-align: left;
-            }}
-            QPushButton:hover {{
-                background-color: {border_color}30;
-                border: 2px solid #ffffff;
-            }}
-            QPushButton:pressed {{
-                background-color: {border_color}50;
-                border: 3px solid {border_color};
-            }}
-        """)
-
-        # Detectar si es componente para restaurar color correcto
-        is_component = self.item_type in ['comment', 'alert', 'note', 'divider']
-
-        if is_component:
-            bg_color = '#1a2332'  # Azul oscuro para componentes
-            hover_color = '#223244'
-        else:
-            bg_color = '#2d2d2d'  # Gris oscuro para relaciones
-            hover_color = '#353535'
-
-        self.card_frame.setStyleSheet(f"""
-            QFrame#cardFrame {{
-                background-color: {bg_color};
-                border: 2px solid {border_color};
-                border-radius: 8px;
-                padding: 12px;
-            }}
-            QFrame#cardFrame:hover {{
-                background-color: {hover_color};
-                border-color: #ffffff;
-            }}
-        """)
+        self._set_copied_style(False)
 
         # Restaurar sombra
-        self.shadow.setBlurRadius(10)
-        self.shadow.setYOffset(2)
-        self.shadow.setColor(QColor(0, 0, 0, 60))
+        self.set_shadow_state('hover' if self.is_hovered else 'normal')
+
+    def _set_copied_style(self, copied: bool):
+        """Activa/desactiva el estilo de copiado del botón (propiedad 'copied' + re-polish)"""
+        self.name_button.setProperty("copied", copied)
+        self.name_button.style().polish(self.name_button)
+
+    @classmethod
+    def _get_copied_font(cls) -> QFont:
+        """Fuente del texto 'Copiado!' (compartida por todas las cards)"""
+        if cls._copied_font is None:
+            cls._copied_font = QFont()
+            cls._copied_font.setPointSize(8)
+            cls._copied_font.setBold(True)
+        return cls._copied_font
 
     def paintEvent(self, event):
-        """Dibuja el indicador de copiado si está activo"""
+        """Dibuja la sombra pre-renderizada, el frame y el indicador de copiado si está activo"""
         super().paintEvent(event)
 
-        if self.show_copied_indicator:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Sombra: un único blit del fondo cacheado
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background_pixmap(
+            self.shadow_state, self.width(), self.height(), self.devicePixelRatioF()
+        ))
 
-            # Dibujar círculo de fondo
-            center_x = self.width() - 30
-            center_y = 30
-            radius = 20
+        # Fondo y borde de la card
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._border_pen)
+        painter.setBrush(self._frame_color)
+        inset = self._border_pen.widthF() / 2
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(inset, inset, -inset, -inset),
+                                self.CARD_RADIUS, self.CARD_RADIUS)
 
-            # Círculo verde con borde
-            painter.setBrush(QColor(0, 255, 136))
-            painter.setPen(QPen(QColor(0, 200, 100), 2))
-            painter.drawEllipse(center_x - radius, center_y - radius, radius * 2, radius * 2)
-
-            # Dibujar checkmark
-            painter.setPen(QPen(QColor(0, 0, 0), 3, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
-
-            # Línea 1 del check (parte corta)
-            painter.drawLine(center_x - 8, center_y, center_x - 3, center_y + 6)
-
-            # Línea 2 del check (parte larga)
-            painter.drawLine(center_x - 3, center_y + 6, center_x + 8, center_y - 6)
-
-            # Texto "Copiado!"
-            painter.setPen(QColor(0, 255, 136))
-            font = QFont()
-            font.setPointSize(8)
-            font.setBold(True)
-            painter.setFont(font)
-            painter.drawText(center_x - 30, center_y + 35, "Copiado!")
+        if self.show_copied_indicator:
+            self._paint_copied_overlay(painter)
+        painter.end()
+
+    def _paint_copied_overlay(self, painter: QPainter):
+        """Dibuja el checkmark y el texto 'Copiado!'"""
+        # Antialiasing solo en pantallas de alta densidad
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, self.devicePixelRatioF() > 1.0)
+
+        # Centro del círculo en la esquina superior derecha
+        painter.translate(self.width() - 30, 30)
+
+        # Círculo verde con borde
+        painter.setBrush(self._CHECK_BRUSH)
+        painter.setPen(self._CIRCLE_PEN)
+        painter.drawEllipse(self._CHECK_BG_RECT)
+
+        # Checkmark (dos líneas precalculadas)
+        painter.setPen(self._CHECK_PEN)
+        painter.drawLines(self._CHECK_LINES)
+
+        # Texto "Copiado!"
+        painter.setPen(self._COPIED_COLOR)
+        painter.setFont(self._get_copied_font())
+        painter.drawText(-30, 35, "Copiado!")
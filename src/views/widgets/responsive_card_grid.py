@@ -21,6 +21,8 @@ class ResponsiveCardGrid(QWidget):
 
     # Señal cuando cambia el número de columnas
     columns_changed = pyqtSignal(int)
+    # Señal única para el click de cualquier card (reenvía card.clicked)
+    card_clicked = pyqtSignal(str)
 
     # Breakpoints para responsive
     BREAKPOINTS = {
@@ -88,6 +90,9 @@ class ResponsiveCardGrid(QWidget):
         """Agrega una card al grid"""
         self.cards.append(card_widget)
 
+        # Reenvío señal a señal (sin slot Python por card)
+        card_widget.clicked.connect(self.card_clicked)
+
         # Si es la primera card, inicializar columnas
         if self.current_columns == 0:
             self.current_columns = self._calculate_columns(self.width())